@@ -6,6 +6,10 @@ from google.cloud import monitoring_v3
 # Try to get project from env or default
 project_id = os.environ.get("GOOGLE_CLOUD_PROJECT", "ucr-research-computing")
 
+# Only print a sample; keep the page small so the pager doesn't pull more
+# series over the wire than we display.
+MAX_RESULTS = 20
+
 client = monitoring_v3.MetricServiceClient()
 project_name = f"projects/{project_id}"
 
@@ -31,10 +35,12 @@ try:
             ),
             "interval": interval,
             "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+            "page_size": MAX_RESULTS,
         }
     )
 
     count = 0
+    rows = []
     for result in results:
         count += 1
         # Resource labels usually contain instance_id or zone
@@ -47,12 +53,19 @@ try:
             latest_point = result.points[0]
             cpu_val = latest_point.value.double_value * 100
             # CPU utilization is a double
-            print(
+            rows.append(
                 f"Project: {pid:<25} | "
                 f"ID: {instance_id:<20} ({zone}) | "
                 f"CPU: {cpu_val:>6.2f}%"
             )
 
+        if count >= MAX_RESULTS:
+            rows.append(f"... (showing first {MAX_RESULTS} series)")
+            break
+
+    if rows:
+        print("\n".join(rows))
+
     if count == 0:
         print(
             "No data found. (Check if instances are running "
@@ -1,116 +1,317 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Any
-
-import google.cloud.storage  # type: ignore[import-not-found, unused-ignore]
-from google.cloud import (
-    asset_v1,
-    compute_v1,
-    container_v1,
-    filestore_v1,
-    iam_admin_v1,
-    monitoring_v3,
-    notebooks_v1,
-    resourcemanager_v3,
-    run_v2,
-)
+import itertools
+from collections.abc import Callable, Collection
+from functools import wraps
+from threading import Lock, local
+from typing import Any, TypeVar
+
+from .core import FATAL_ERRORS, GRPC_CHANNEL_POOL_SIZE, GRPC_KEEPALIVE_TIME_MS
+from .logger import logger
+
+
+class ClientPool:
+    """Thread-safe round-robin over clients that each own a separate gRPC channel."""
+
+    def __init__(self, clients: list[Any]) -> None:
+        self._clients = clients
+        self._cycle = itertools.cycle(clients)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def get(self) -> Any:
+        with self._lock:
+            return next(self._cycle)
+
+
+def _pooled_channel_factory(transport_cls: Any, index: int) -> Callable[..., Any]:
+    """Builds a channel factory whose options differ per index.
+
+    gRPC C-core collapses channels with identical arguments onto one TCP
+    connection, so a distinct channel arg is what makes the pool real.
+    """
+
+    def create_channel(host: str, **kwargs: Any) -> Any:
+        kwargs["options"] = [
+            *kwargs.get("options", []),
+            ("grpc.channel_pooling_index", index),
+            ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+            ("grpc.keepalive_permit_without_calls", 1),
+        ]
+        return transport_cls.create_channel(host, **kwargs)
+
+    return create_channel
+
+
+def _grpc_pool(client_cls: Any, size: int = GRPC_CHANNEL_POOL_SIZE) -> ClientPool:
+    transport_cls = client_cls.get_transport_class("grpc")
+    return ClientPool(
+        [
+            client_cls(
+                transport=transport_cls(
+                    channel=_pooled_channel_factory(transport_cls, i)
+                )
+            )
+            for i in range(size)
+        ]
+    )
+
+
+T = TypeVar("T")
+_UNSET: Any = object()
+
+
+def _shared(factory: Callable[[], T]) -> Callable[[], T]:
+    """Memoizes a zero-arg factory, like lru_cache(maxsize=1).
+
+    Unlike lru_cache, first calls racing in from several scan workers build
+    the client once instead of each constructing (and dropping) their own.
+    """
+    lock = Lock()
+    value: Any = _UNSET
+
+    @wraps(factory)
+    def get() -> T:
+        nonlocal value
+        if value is _UNSET:
+            with lock:
+                if value is _UNSET:
+                    value = factory()
+        return value  # type: ignore[no-any-return]
+
+    return get
+
 
 # Shared Client Registry (Lazy-loaded and cached)
+# GCP libraries are imported inside each factory so a run only pays the
+# import cost (proto descriptors, generated classes) of the services it uses.
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_compute_instances_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.InstancesClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_compute_images_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.ImagesClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_compute_machine_images_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.MachineImagesClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_compute_snapshots_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.SnapshotsClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_disks_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.DisksClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_firewalls_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.FirewallsClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_networks_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.NetworksClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_subnetworks_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.SubnetworksClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_addresses_client() -> Any:
+    from google.cloud import compute_v1
+
     return compute_v1.AddressesClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
+def _monitoring_pool() -> ClientPool:
+    from google.cloud import monitoring_v3
+
+    return _grpc_pool(monitoring_v3.MetricServiceClient)
+
+
 def get_monitoring_client() -> Any:
-    return monitoring_v3.MetricServiceClient()
+    return _monitoring_pool().get()
+
+
+@_shared
+def _asset_pool() -> ClientPool:
+    from google.cloud import asset_v1
+
+    return _grpc_pool(asset_v1.AssetServiceClient)
 
 
-@lru_cache(maxsize=1)
 def get_asset_client() -> Any:
-    return asset_v1.AssetServiceClient()
+    return _asset_pool().get()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_projects_client() -> Any:
+    from google.cloud import resourcemanager_v3
+
     return resourcemanager_v3.ProjectsClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
+def _gke_pool() -> ClientPool:
+    from google.cloud import container_v1
+
+    return _grpc_pool(container_v1.ClusterManagerClient)
+
+
 def get_gke_client() -> Any:
-    return container_v1.ClusterManagerClient()
+    return _gke_pool().get()
+
+
+_sql_local = local()
+
+
+@_shared
+def _default_credentials() -> Any:
+    import google.auth
+
+    credentials, _ = google.auth.default(
+        scopes=["https://www.googleapis.com/auth/cloud-platform"]
+    )
+    return credentials
 
 
-@lru_cache(maxsize=1)
 def get_sql_client() -> Any:
-    from googleapiclient import discovery
+    """
+    One sqladmin discovery client per thread. httplib2 is not thread-safe, but
+    a per-thread Http keeps its connection alive across projects.
+    """
+    client = getattr(_sql_local, "client", None)
+    if client is None:
+        import google_auth_httplib2
+        import httplib2
+        from googleapiclient import discovery
+
+        http = google_auth_httplib2.AuthorizedHttp(
+            _default_credentials(), http=httplib2.Http()
+        )
+        client = discovery.build(
+            "sqladmin", "v1beta4", http=http, cache_discovery=False
+        )
+        _sql_local.client = client
+    return client
 
-    return discovery.build("sqladmin", "v1beta4", cache_discovery=False)
+
+@_shared
+def _filestore_pool() -> ClientPool:
+    from google.cloud import filestore_v1
+
+    return _grpc_pool(filestore_v1.CloudFilestoreManagerClient)
 
 
-@lru_cache(maxsize=1)
 def get_filestore_client() -> Any:
-    return filestore_v1.CloudFilestoreManagerClient()
+    return _filestore_pool().get()
+
+
+@_shared
+def _run_pool() -> ClientPool:
+    from google.cloud import run_v2
+
+    return _grpc_pool(run_v2.ServicesClient)
 
 
-@lru_cache(maxsize=1)
 def get_run_client() -> Any:
-    return run_v2.ServicesClient()
+    return _run_pool().get()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_iam_client() -> Any:
+    from google.cloud import iam_admin_v1
+
     return iam_admin_v1.IAMClient()
 
 
-@lru_cache(maxsize=1)
+@_shared
+def _notebook_pool() -> ClientPool:
+    from google.cloud import notebooks_v1
+
+    return _grpc_pool(notebooks_v1.NotebookServiceClient)
+
+
 def get_notebook_client() -> Any:
-    return notebooks_v1.NotebookServiceClient()
+    return _notebook_pool().get()
 
 
-@lru_cache(maxsize=1)
+@_shared
 def get_storage_client() -> Any:
-    return google.cloud.storage.Client()
+    from google.cloud import storage  # type: ignore[attr-defined, unused-ignore]
+
+    return storage.Client()
+
+
+# Client factories used by each audit service
+SERVICE_CLIENTS: dict[str, tuple[Callable[[], Any], ...]] = {
+    "compute": (
+        get_compute_instances_client,
+        get_compute_images_client,
+        get_compute_machine_images_client,
+        get_compute_snapshots_client,
+        get_monitoring_client,
+    ),
+    "storage": (get_storage_client, get_monitoring_client),
+    "gke": (get_gke_client, get_asset_client),
+    "vertex": (get_notebook_client, get_asset_client),
+    "sql": (),  # Per-thread discovery client, built by each worker
+    "filestore": (get_filestore_client,),
+    "iam": (get_iam_client, get_projects_client),
+    "run": (get_run_client, get_asset_client),
+    "network": (
+        get_firewalls_client,
+        get_networks_client,
+        get_subnetworks_client,
+        get_addresses_client,
+    ),
+}
+
+
+def prewarm_clients(services: Collection[str]) -> None:
+    """
+    Builds the cached clients for the given services up front on the calling
+    thread, so the first wave of scan workers doesn't race to construct them.
+    Errors are left for the scans themselves to report: a failing service is
+    skipped, and missing credentials (which every service would hit) end it.
+    """
+    for svc in services:
+        for factory in SERVICE_CLIENTS.get(svc, ()):
+            try:
+                factory()
+            except FATAL_ERRORS as e:
+                logger.debug(f"Could not pre-build clients: {e}")
+                return
+            except Exception as e:
+                logger.debug(f"Could not pre-build {svc} clients: {e}")
+                break
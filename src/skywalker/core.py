@@ -1,12 +1,31 @@
-from tenacity import stop_after_attempt, wait_exponential
+from functools import lru_cache
+from typing import Any
+
+from google.api_core import exceptions as api_exceptions
+from google.auth import exceptions as auth_exceptions
+from rich.console import Console
+from tenacity import retry_if_not_exception_type, stop_after_attempt, wait_exponential
+
+# Credential failures that no retry or other region/project can recover from.
+# Scans let these propagate so a bad login aborts the audit immediately.
+FATAL_ERRORS = (
+    auth_exceptions.DefaultCredentialsError,
+    auth_exceptions.RefreshError,
+    api_exceptions.Unauthenticated,
+)
 
 # Shared retry configuration
 # usage: @retry(**RETRY_CONFIG)
 RETRY_CONFIG = {
     "stop": stop_after_attempt(3),
     "wait": wait_exponential(multiplier=1, min=4, max=10),
+    "retry": retry_if_not_exception_type(FATAL_ERRORS),
 }
 
+# Cloud Monitoring metrics scope used by fleet-wide queries when
+# --scoping-project is not given
+DEFAULT_SCOPING_PROJECT = "ucr-research-computing"
+
 # Standard US Regions for auditing
 # These cover the vast majority of UCR/Research workloads.
 STANDARD_REGIONS = [
@@ -21,3 +40,67 @@ STANDARD_REGIONS = [
 # Standard suffixes to generate zones from regions
 # e.g. us-central1 -> us-central1-a, us-central1-b, ...
 ZONE_SUFFIXES = ["a", "b", "c", "f"]
+
+
+@lru_cache(maxsize=32)
+def zones_for_regions(regions: tuple[str, ...]) -> tuple[str, ...]:
+    """Expands regions into their standard zones (memoized per region set)."""
+    return tuple(f"{r}-{s}" for r in regions for s in ZONE_SUFFIXES)
+
+
+# Decimal suffixes, as used by humanize.naturalsize
+_SIZE_SUFFIXES = ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB", "RB", "QB")
+
+
+@lru_cache(maxsize=1024)
+def format_size(n: int) -> str:
+    """
+    Same output as humanize.naturalsize(n) for byte counts, without its
+    per-call gettext and log() overhead. Shared by the console listings and
+    the HTML report so both print sizes identically.
+    """
+    if n == 1:
+        return "1 Byte"
+    if n < 1000:
+        return f"{n} Bytes"
+    exp = min((len(str(n)) - 1) // 3, len(_SIZE_SUFFIXES))
+    # Rounding can carry into the next suffix (999_999 -> "1.0 MB")
+    if exp < len(_SIZE_SUFFIXES) and float(f"{n / 1000**exp:.1f}") >= 1000:
+        exp += 1
+    return f"{n / 1000**exp:.1f} {_SIZE_SUFFIXES[exp - 1]}"
+
+
+# Number of gRPC channels per high-fanout client (Monitoring, Asset, GKE, ...).
+# A single HTTP/2 channel caps concurrent streams (~100), so parallel scans
+# round-robin across a small pool of independent channels instead.
+GRPC_CHANNEL_POOL_SIZE = 4
+
+# HTTP/2 keepalive ping interval for pooled channels, so connections that sit
+# idle between a fleet's projects are not silently dropped and re-dialled.
+# Pings are sent even with no call in flight; one a minute stays well inside
+# what Google front ends accept before answering with GOAWAY (too_many_pings).
+GRPC_KEEPALIVE_TIME_MS = 60_000
+
+# Worker threads per project in flight. All zonal/regional scans of every
+# project share one executor of `--concurrency * SCAN_WORKERS_PER_PROJECT`.
+SCAN_WORKERS_PER_PROJECT = 16
+
+# Upper bound on that shared executor, however large --concurrency gets.
+# Extra tasks queue instead of each getting a thread (and a gRPC stream).
+MAX_SCAN_WORKERS = 128
+
+
+class QuietConsole(Console):
+    """
+    Console for --json runs. A quiet Rich console still parses markup and
+    renders every print before discarding it; this one skips the work.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(quiet=True, **kwargs)
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        pass
+
+    def log(self, *objects: Any, **kwargs: Any) -> None:
+        pass
@@ -3,9 +3,8 @@ from importlib.metadata import version
 
 from rich.console import Console
 
-from .core import STANDARD_REGIONS
+from .core import STANDARD_REGIONS, QuietConsole
 from .logger import logger
-from .modes import audit, fix, monitor, zombies
 
 
 def main() -> None:
@@ -155,30 +154,38 @@ Examples:
 
         logger.setLevel(logging.WARNING)
 
-    # Use stderr for logs/progress if stdout is piped for JSON
-    log_console = Console(stderr=True, quiet=args.json)
-    out_console = Console(quiet=args.json)
+    # Use stderr for logs/progress if stdout is piped for JSON. JSON mode
+    # prints nothing, so skip Rich rendering altogether.
+    console_cls = QuietConsole if args.json else Console
+    log_console = console_cls(stderr=True)
+    out_console = console_cls()
 
     log_console.print(
         "[bold green]Skywalker[/bold green] Ursa Major Auditor initialized."
     )
 
-    # Dispatch to Modes
+    # Dispatch to Modes (imported lazily so each run only loads its own mode)
     from rich.markup import escape
 
     if args.fix:
+        from .modes import fix
+
         try:
             fix.run_fix(args, log_console, out_console)
         except Exception as e:
             logger.error(f"Fix Failed: {escape(str(e))}")
             exit(1)
     elif args.monitor:
+        from .modes import monitor
+
         try:
             monitor.run_fleet_monitor(args, log_console, out_console)
         except Exception as e:
             logger.error(f"Fleet Monitor Failed: {escape(str(e))}")
             exit(1)
     elif args.find_zombies:
+        from .modes import zombies
+
         try:
             zombies.run_zombie_hunt(args, log_console, out_console)
         except Exception as e:
@@ -186,6 +193,8 @@ Examples:
             exit(1)
     else:
         # Audit Mode
+        from .modes import audit
+
         try:
             audit.run_fleet_audit(args, log_console, out_console)
         except Exception as e:
@@ -1,74 +1,170 @@
-import json
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from collections.abc import Callable, Collection
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, cast
+from functools import partial
+from itertools import chain
+from typing import Any, BinaryIO, cast
 
-import humanize
-from rich.console import Console
+import orjson
+from pydantic import TypeAdapter
+from rich.console import Console, RenderableType
 from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TextColumn,
     TimeElapsedColumn,
 )
+from rich.text import Text
 
-from ..core import ZONE_SUFFIXES
+from ..clients import prewarm_clients
+from ..core import (
+    FATAL_ERRORS,
+    MAX_SCAN_WORKERS,
+    SCAN_WORKERS_PER_PROJECT,
+    format_size,
+    zones_for_regions,
+)
 from ..logger import logger
 from ..schemas.compute import GCPComputeInstance, GCPComputeReport
 from ..schemas.filestore import GCPFilestoreInstance
 from ..schemas.gke import GCPCluster
+from ..schemas.iam import GCPIAMReport
+from ..schemas.network import GCPNetworkReport
 from ..schemas.run import GCPCloudRunService
+from ..schemas.sql import GCPSQLInstance
+from ..schemas.storage import GCPBucket
 from ..schemas.vertex import GCPVertexReport
-from ..users import UserResolver
-from ..walkers import (
-    compute,
-    filestore,
-    gke,
-    iam,
-    network,
-    org,
-    run,
-    sql,
-    storage,
-    vertex,
+from ..users import get_user_resolver
+
+# Walker modules are imported inside the scan functions that use them, so
+# an audit only loads the client libraries of the services it was asked for.
+
+# Services covered by `--services all`
+ALL_SERVICES = frozenset(
+    {
+        "compute",
+        "storage",
+        "gke",
+        "vertex",
+        "sql",
+        "filestore",
+        "iam",
+        "run",
+        "network",
+    }
 )
 
+# Tasks that scan a project-level (non-regional) service once per project
+GLOBAL_SERVICES = frozenset(
+    {
+        "compute_images",
+        "compute_machine_images",
+        "compute_snapshots",
+        "iam",
+        "sql",
+        "network",
+        "storage",
+    }
+)
+
+# Pseudo-service of the fleet task that plans a project's scans
+PLAN_TASK = "plan"
+
+# Cloud Asset types whose locations decide which regions a service is scanned in
+REGIONAL_ASSET_TYPES: dict[str, tuple[str, ...]] = {
+    "run": ("run.googleapis.com/Service",),
+    "gke": ("container.googleapis.com/Cluster",),
+    "vertex": (
+        "notebooks.googleapis.com/Instance",
+        "aiplatform.googleapis.com/Model",
+        "aiplatform.googleapis.com/Endpoint",
+    ),
+}
+
+# Vertex AI resource kinds, each scanned as its own per-region task
+VERTEX_RESOURCES = ("notebooks", "models", "endpoints")
+
+# Project-level Compute Engine listings, each its own task
+COMPUTE_IMAGE_RESOURCES = ("images", "machine_images", "snapshots")
+
+# One compiled serializer per service for --json output, instead of walking
+# every item's schema through model_dump().
+_SERVICE_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    "compute": TypeAdapter(GCPComputeReport),
+    "storage": TypeAdapter(list[GCPBucket]),
+    "gke": TypeAdapter(list[GCPCluster]),
+    "vertex": TypeAdapter(GCPVertexReport),
+    "sql": TypeAdapter(list[GCPSQLInstance]),
+    "filestore": TypeAdapter(list[GCPFilestoreInstance]),
+    "iam": TypeAdapter(GCPIAMReport),
+    "run": TypeAdapter(list[GCPCloudRunService]),
+    "network": TypeAdapter(GCPNetworkReport),
+}
+
 
-def scan_compute_zone(
-    project_id: str, zone: str, include_metrics: bool = False
+def scan_compute_instances(
+    project_id: str, zones: Collection[str]
 ) -> list[GCPComputeInstance]:
+    from ..walkers import compute
+
     try:
-        return compute.list_instances(
-            project_id=project_id, zone=zone, include_metrics=include_metrics
+        return cast(
+            list[GCPComputeInstance],
+            compute.list_instances_aggregated(project_id=project_id, zones=zones),
         )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.warning(f"Failed to scan compute zone {zone} for {project_id}: {e}")
+        logger.warning(f"Failed to scan compute instances for {project_id}: {e}")
         return []
 
 
-def scan_filestore_location(
-    project_id: str, location: str
+def scan_compute_metrics(project_id: str) -> dict[str, dict[str, float]]:
+    from ..walkers import compute
+
+    try:
+        return compute.fetch_instance_metrics(project_id)
+    except FATAL_ERRORS:
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to fetch compute metrics for {project_id}: {e}")
+        return {}
+
+
+def scan_filestore(
+    project_id: str, locations: Collection[str]
 ) -> list[GCPFilestoreInstance]:
+    from ..walkers import filestore
+
     try:
-        return cast(
-            list[GCPFilestoreInstance],
-            filestore.list_instances(project_id=project_id, location=location),
+        return filestore.list_instances_all_locations(
+            project_id=project_id, locations=locations
         )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.warning(
-            f"Failed to scan filestore location {location} for {project_id}: {e}"
-        )
+        logger.warning(f"Failed to scan filestore for {project_id}: {e}")
         return []
 
 
 def scan_run_region(project_id: str, region: str) -> list[GCPCloudRunService]:
+    from ..walkers import run
+
     try:
-        return cast(
-            list[GCPCloudRunService],
-            run.list_services(project_id=project_id, region=region),
-        )
+        return run.list_services(project_id=project_id, region=region)
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(
             f"Failed to scan Cloud Run region {region} for {project_id}: {e}"
@@ -76,198 +172,460 @@ def scan_run_region(project_id: str, region: str) -> list[GCPCloudRunService]:
         return []
 
 
-def scan_gke_location(project_id: str, location: str) -> list[GCPCluster]:
+def scan_gke(project_id: str, locations: Collection[str]) -> list[GCPCluster]:
+    from ..walkers import gke
+
     try:
-        return cast(
-            list[GCPCluster],
-            gke.list_clusters(project_id=project_id, location=location),
+        return gke.list_clusters_all_locations(
+            project_id=project_id, locations=locations
         )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.warning(f"Failed to scan GKE location {location} for {project_id}: {e}")
+        logger.warning(f"Failed to scan GKE for {project_id}: {e}")
         return []
 
 
-def scan_vertex_location(project_id: str, location: str) -> GCPVertexReport:
+def scan_vertex_location(project_id: str, location: str, resource: str) -> list[Any]:
+    """One Vertex AI resource kind (notebooks/models/endpoints) in one region."""
+    from ..walkers import vertex
+
+    listers: dict[str, Callable[..., list[Any]]] = {
+        "notebooks": vertex.list_notebooks,
+        "models": vertex.list_models,
+        "endpoints": vertex.list_endpoints,
+    }
     try:
-        return cast(
-            GCPVertexReport,
-            vertex.get_vertex_report(project_id=project_id, location=location),
-        )
+        return listers[resource](project_id=project_id, location=location)
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(
-            f"Failed to scan Vertex AI location {location} for {project_id}: {e}"
+            f"Failed to scan Vertex AI {resource} in {location} for {project_id}: {e}"
         )
-        return GCPVertexReport()
+        return []
 
 
-def run_audit_for_project(
+def scan_compute_images(
+    project_id: str, console: Console, resource: str
+) -> list[Any] | None:
+    """Project-level Compute Engine images, machine images or snapshots."""
+    from ..walkers import compute
+
+    listers: dict[str, Callable[[str], list[Any]]] = {
+        "images": compute.list_images,
+        "machine_images": compute.list_machine_images,
+        "snapshots": compute.list_snapshots,
+    }
+    try:
+        return listers[resource](project_id)
+    except FATAL_ERRORS:
+        raise
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: Failed to list {resource.replace('_', ' ')}: "
+            f"{e}[/yellow]"
+        )
+        return None
+
+
+def scan_iam(project_id: str) -> GCPIAMReport:
+    from ..walkers import iam
+
+    iam_res = cast(GCPIAMReport, iam.get_iam_report(project_id))
+    # Resolve names early for all reports (each owner once, across bindings)
+    owners = {
+        user
+        for binding in iam_res.policy_bindings
+        if binding.role == "roles/owner"
+        for user in binding.categorized_members["users"]
+    }
+    iam_res.user_display_names.update(get_user_resolver().get_display_names(owners))
+    return iam_res
+
+
+def scan_sql(project_id: str, console: Console) -> list[GCPSQLInstance] | None:
+    from ..walkers import sql
+
+    try:
+        return cast(list[GCPSQLInstance], sql.list_instances(project_id))
+    except FATAL_ERRORS:
+        raise
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: SQL scan failed for {project_id}: {e}[/yellow]"
+        )
+        return None
+
+
+def scan_network(project_id: str, console: Console) -> GCPNetworkReport | None:
+    from ..walkers import network
+
+    try:
+        return cast(GCPNetworkReport, network.get_network_report(project_id))
+    except FATAL_ERRORS:
+        raise
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: Network scan failed for {project_id}: {e}[/yellow]"
+        )
+        return None
+
+
+def scan_storage(project_id: str, console: Console) -> list[GCPBucket] | None:
+    from ..walkers import storage
+
+    try:
+        return cast(list[GCPBucket], storage.list_buckets(project_id))
+    except FATAL_ERRORS:
+        raise
+    except Exception as e:
+        console.print(
+            f"[yellow]Warning: Storage scan failed for {project_id}: {e}[/yellow]"
+        )
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class LocationScan:
+    """A scan that fans out over one project's regions."""
+
+    task: str  # task name, also the key of its results
+    service: str  # the --services entry that enables it
+    scan: Callable[..., Any]  # called as scan(project_id, region)
+
+
+# Regional scans, planned uniformly by plan_project_scans. Each only visits
+# the regions find_active_regions reports for its service.
+LOCATION_SCANS = (
+    LocationScan("run", "run", scan_run_region),
+    # Notebooks, models and endpoints are separate APIs, so each gets its own
+    # task per region instead of being listed back to back.
+    *(
+        LocationScan(
+            f"vertex_{res}", "vertex", partial(scan_vertex_location, resource=res)
+        )
+        for res in VERTEX_RESOURCES
+    ),
+)
+
+
+def find_active_regions(
+    project_id: str, services: Collection[str], regions: list[str]
+) -> dict[str, list[str]]:
+    """
+    Narrows each regional service (Run, GKE, Vertex) to the regions where the
+    project actually has resources, using one Cloud Asset search. Falls back to
+    every requested region if the Asset API is unavailable for the project.
+    """
+    wanted = [svc for svc in REGIONAL_ASSET_TYPES if svc in services]
+    if not wanted:
+        return {}
+
+    from ..walkers import asset
+
+    locations = asset.search_resource_locations(
+        f"projects/{project_id}",
+        [t for svc in wanted for t in REGIONAL_ASSET_TYPES[svc]],
+    )
+    if locations is None:
+        return dict.fromkeys(wanted, regions)
+
+    active: dict[str, list[str]] = {}
+    for svc in wanted:
+        found: set[str] = set()
+        for asset_type in REGIONAL_ASSET_TYPES[svc]:
+            for loc in locations.get(asset_type, ()):
+                # Zonal resources (e.g. us-west1-b) count towards their region
+                found.update((loc, loc.rsplit("-", 1)[0]))
+        active[svc] = [r for r in regions if r in found]
+    return active
+
+
+def plan_project_scans(
     project_id: str,
-    services: list[str],
+    services: Collection[str],
     regions: list[str],
     console: Console,
     include_metrics: bool = False,
+) -> list[tuple[str, Callable[[], Any]]]:
+    """
+    Expands a project audit into independent (service, scan) work items so that
+    every zone/region of every service can be scheduled on one shared executor.
+    """
+    tasks: list[tuple[str, Callable[[], Any]]] = []
+    # `--regions us-central1 us-central1` must not scan the same region twice
+    regions = list(dict.fromkeys(regions))
+
+    # --- Project-level (Global) services: one task each, so they overlap
+    # with each other and with the zonal/regional scans ---
+    if "compute" in services:
+        tasks.extend(
+            (f"compute_{res}", partial(scan_compute_images, project_id, console, res))
+            for res in COMPUTE_IMAGE_RESOURCES
+        )
+    if "iam" in services:
+        tasks.append(("iam", partial(scan_iam, project_id)))
+    if "sql" in services:
+        tasks.append(("sql", partial(scan_sql, project_id, console)))
+    if "network" in services:
+        tasks.append(("network", partial(scan_network, project_id, console)))
+    if "storage" in services:
+        tasks.append(("storage", partial(scan_storage, project_id, console)))
+
+    target_zones = zones_for_regions(tuple(regions))
+    active_regions = find_active_regions(project_id, services, regions)
+
+    # --- Compute Engine (Zonal) ---
+    if "compute" in services:
+        # One aggregatedList call covers every zone; metrics are likewise
+        # fetched once project-wide and merged in the report.
+        tasks.append(
+            ("compute", partial(scan_compute_instances, project_id, target_zones))
+        )
+        if include_metrics:
+            tasks.append(("compute_metrics", partial(scan_compute_metrics, project_id)))
+
+    # --- Filestore (Zonal and Regional) ---
+    if "filestore" in services:
+        # One `locations/-` listing replaces a call per (mostly empty) zone,
+        # and also picks up regional (Enterprise) instances.
+        tasks.append(
+            (
+                "filestore",
+                partial(scan_filestore, project_id, (*target_zones, *regions)),
+            )
+        )
+
+    # --- GKE (Zonal and Regional) ---
+    if "gke" in services and active_regions["gke"]:
+        # One `locations/-` listing covers zonal and regional clusters alike
+        gke_regions = tuple(active_regions["gke"])
+        gke_locations = (*zones_for_regions(gke_regions), *gke_regions)
+        tasks.append(("gke", partial(scan_gke, project_id, gke_locations)))
+
+    # --- Regional services ---
+    for spec in LOCATION_SCANS:
+        if spec.service in services:
+            tasks.extend(
+                (spec.task, partial(spec.scan, project_id, r))
+                for r in active_regions[spec.service]
+            )
+
+    return tasks
+
+
+def build_project_report(
+    project_id: str, services: Collection[str], results: dict[str, list[Any]]
 ) -> dict[str, Any]:
     """
-    Executes all requested walkers for a single project and returns the combined data.
+    Assembles the per-service scan results of one project into its report.
+    `results` maps each task's service name to the list of its task results.
     """
     report_data: dict[str, Any] = {
         "project_id": project_id,
         "scan_time": datetime.now(timezone.utc),
         "services": {},
     }
+    # Project-level services run as a single task each; None marks a failed scan
+    global_results = {
+        svc: items[0]
+        for svc, items in results.items()
+        if svc in GLOBAL_SERVICES and items[0] is not None
+    }
 
-    # --- Compute Engine (Zonal + Global) ---
     if "compute" in services:
-        compute_report = GCPComputeReport()
-
-        # 1. Instances (Zonal)
-        target_zones = [f"{r}-{s}" for r in regions for s in ZONE_SUFFIXES]
-        with ThreadPoolExecutor(max_workers=10) as compute_executor:
-            future_to_zone = {
-                compute_executor.submit(
-                    scan_compute_zone, project_id, z, include_metrics
-                ): z
-                for z in target_zones
-            }
-            for compute_future in as_completed(future_to_zone):
-                compute_report.instances.extend(compute_future.result())
-
-        # 2. Images & Snapshots (Global/Project-level)
-        try:
-            compute_report.images = compute.list_images(project_id)
-            compute_report.machine_images = compute.list_machine_images(project_id)
-            compute_report.snapshots = compute.list_snapshots(project_id)
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Failed to list images/snapshots: {e}[/yellow]"
-            )
+        compute_report = GCPComputeReport(
+            images=global_results.get("compute_images", []),
+            machine_images=global_results.get("compute_machine_images", []),
+            snapshots=global_results.get("compute_snapshots", []),
+        )
+        for instances in results.get("compute", []):
+            compute_report.instances.extend(instances)
+        from ..walkers import compute
 
+        for metrics in results.get("compute_metrics", []):
+            compute.apply_instance_metrics(compute_report.instances, metrics)
         report_data["services"]["compute"] = compute_report
 
-    # --- Cloud Run (Regional) ---
-    if "run" in services:
-        run_results = []
-        with ThreadPoolExecutor(max_workers=len(regions)) as executor:
-            futures = [executor.submit(scan_run_region, project_id, r) for r in regions]
-            for future in as_completed(futures):
-                run_results.extend(future.result())
-        report_data["services"]["run"] = run_results
-
-    # --- Filestore (Zonal) ---
-    if "filestore" in services:
-        filestore_results = []
-        target_zones = [f"{r}-{s}" for r in regions for s in ZONE_SUFFIXES]
-        with ThreadPoolExecutor(max_workers=10) as fs_executor:
-            fs_futures = [
-                fs_executor.submit(scan_filestore_location, project_id, z)
-                for z in target_zones
-            ]
-            for fs_future in as_completed(fs_futures):
-                filestore_results.extend(fs_future.result())
-        report_data["services"]["filestore"] = filestore_results
-
-    # --- GKE (Regional) ---
-    if "gke" in services:
-        gke_results = []
-        with ThreadPoolExecutor(max_workers=len(regions)) as gke_executor:
-            gke_futures = [
-                gke_executor.submit(scan_gke_location, project_id, r) for r in regions
-            ]
-            for gke_future in as_completed(gke_futures):
-                gke_results.extend(gke_future.result())
-        report_data["services"]["gke"] = gke_results
-
-    # --- IAM (Global) ---
-    if "iam" in services:
-        iam_res = iam.get_iam_report(project_id)
-        # Resolve names early for all reports
-        resolver = UserResolver()
-        for binding in iam_res.policy_bindings:
-            if "roles/owner" in binding.role:
-                for user in binding.categorized_members["users"]:
-                    display_name = resolver.get_display_name(user)
-                    if display_name:
-                        iam_res.user_display_names[user] = display_name
-        report_data["services"]["iam"] = iam_res
-
-    # --- Cloud SQL (Global call) ---
-    if "sql" in services:
-        try:
-            report_data["services"]["sql"] = sql.list_instances(project_id)
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: SQL scan failed for {project_id}: {e}[/yellow]"
+    for svc in ("run", "filestore", "gke"):
+        if svc in services:
+            report_data["services"][svc] = list(
+                chain.from_iterable(results.get(svc, []))
             )
 
-    # --- Vertex AI (Regional) ---
+    if "iam" in global_results:
+        report_data["services"]["iam"] = global_results["iam"]
+
+    if "sql" in global_results:
+        report_data["services"]["sql"] = global_results["sql"]
+
     if "vertex" in services:
-        vertex_results = GCPVertexReport()
-        with ThreadPoolExecutor(max_workers=len(regions)) as vertex_executor:
-            vertex_futures = [
-                vertex_executor.submit(scan_vertex_location, project_id, r)
-                for r in regions
-            ]
-            for vertex_future in as_completed(vertex_futures):
-                rep = vertex_future.result()
-                vertex_results.notebooks.extend(rep.notebooks)
-                vertex_results.models.extend(rep.models)
-                vertex_results.endpoints.extend(rep.endpoints)
-        report_data["services"]["vertex"] = vertex_results
-
-    # --- Network (Global) ---
-    if "network" in services:
-        try:
-            report_data["services"]["network"] = network.get_network_report(project_id)
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Network scan failed for {project_id}: {e}[/yellow]"
-            )
+        report_data["services"]["vertex"] = GCPVertexReport(
+            notebooks=list(chain.from_iterable(results.get("vertex_notebooks", []))),
+            models=list(chain.from_iterable(results.get("vertex_models", []))),
+            endpoints=list(chain.from_iterable(results.get("vertex_endpoints", []))),
+        )
 
-    # --- Cloud Storage (Global) ---
-    if "storage" in services:
-        try:
-            report_data["services"]["storage"] = storage.list_buckets(project_id)
-        except Exception as e:
-            console.print(
-                f"[yellow]Warning: Storage scan failed for {project_id}: {e}[/yellow]"
-            )
+    for svc in ("network", "storage"):
+        if svc in global_results:
+            report_data["services"][svc] = global_results[svc]
 
     return report_data
 
 
+def run_audit_for_project(
+    project_id: str,
+    services: Collection[str],
+    regions: list[str],
+    console: Console,
+    include_metrics: bool = False,
+) -> dict[str, Any]:
+    """
+    Executes all requested walkers for a single project and returns the combined data.
+    """
+    tasks = plan_project_scans(project_id, services, regions, console, include_metrics)
+    results: dict[str, list[Any]] = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS_PER_PROJECT) as executor:
+        future_to_service = {executor.submit(fn): svc for svc, fn in tasks}
+        # Nothing is reported until the whole project is done, so gather
+        # everything in one pass. A scan that raises (bad credentials, IAM)
+        # fails the project, so whatever has not started yet is cancelled.
+        done, not_done = wait(future_to_service, return_when=FIRST_EXCEPTION)
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            raise next(e for f in done if (e := f.exception()) is not None)
+    for future, svc in future_to_service.items():
+        results[svc].append(future.result())
+    return build_project_report(project_id, services, results)
+
+
+def _json_default(obj: Any) -> Any:
+    # GAPIC timestamps are datetime subclasses (DatetimeWithNanoseconds),
+    # which orjson only encodes as exact datetimes.
+    if isinstance(obj, datetime):
+        return datetime.combine(obj.date(), obj.timetz())
+    raise TypeError
+
+
+class JsonReportStream:
+    """
+    Writes project reports as one JSON array, serializing each project as soon
+    as it completes rather than holding the whole fleet's output in memory.
+    """
+
+    def __init__(self, out: BinaryIO) -> None:
+        self._out = out
+        self._count = 0
+
+    def write(self, report: dict[str, Any]) -> None:
+        entry = {
+            "project_id": report["project_id"],
+            "scan_time": report["scan_time"],
+            # Python mode: datetimes etc. are left for orjson to encode natively
+            "services": {
+                svc_name: _SERVICE_ADAPTERS[svc_name].dump_python(items)
+                for svc_name, items in report["services"].items()
+            },
+        }
+        # Serialized before anything is written, so a failing report
+        # leaves no dangling separator in the array
+        data = orjson.dumps(
+            entry,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_UTC_Z,
+        )
+        self._out.write(b"[\n" if self._count == 0 else b",\n")
+        self._out.write(data)
+        self._out.flush()
+        self._count += 1
+
+    def close(self) -> None:
+        self._out.write(b"\n]\n" if self._count else b"[]\n")
+        self._out.flush()
+
+
 def print_project_summary(data: dict[str, Any], console: Console) -> None:
     project_id = data["project_id"]
     services = data["services"]
-    console.print(f"\n[bold underline]Project: {project_id}[/bold underline]")
+    # Collected and printed in one call: one console lock/render per project
+    lines = [f"\n[bold underline]Project: {project_id}[/bold underline]"]
 
     if "compute" in services:
         report = services["compute"]
-        console.print(f" - Compute: [bold]{len(report.instances)}[/bold] VMs")
+        lines.append(f" - Compute: [bold]{len(report.instances)}[/bold] VMs")
     if "storage" in services:
-        console.print(
+        lines.append(
             f" - Cloud Storage: [bold]{len(services['storage'])}[/bold] buckets"
         )
     if "run" in services:
-        console.print(f" - Cloud Run: [bold]{len(services['run'])}[/bold] services")
+        lines.append(f" - Cloud Run: [bold]{len(services['run'])}[/bold] services")
     if "filestore" in services:
-        console.print(
+        lines.append(
             f" - Filestore: [bold]{len(services['filestore'])}[/bold] instances"
         )
     if "gke" in services:
-        console.print(f" - GKE: [bold]{len(services['gke'])}[/bold] clusters")
+        lines.append(f" - GKE: [bold]{len(services['gke'])}[/bold] clusters")
     if "sql" in services:
-        console.print(f" - Cloud SQL: [bold]{len(services['sql'])}[/bold] instances")
+        lines.append(f" - Cloud SQL: [bold]{len(services['sql'])}[/bold] instances")
     if "iam" in services:
-        console.print(
+        lines.append(
             f" - IAM: [bold]{len(services['iam'].service_accounts)}[/bold] SAs, "
             f"[bold]{len(services['iam'].policy_bindings)}[/bold] Bindings"
         )
     if "network" in services:
-        console.print(
+        lines.append(
             f" - Network: [bold]{len(services['network'].firewalls)}[/bold] Firewalls, "
             f"[bold]{len(services['network'].addresses)}[/bold] Static IPs"
         )
 
+    console.print(*lines, sep="\n")
+
+
+def _cpu_color(utilization: float) -> str:
+    return "red" if utilization > 90 else "yellow" if utilization >= 70 else "green"
+
+
+def _render_instance(inst: GCPComputeInstance, include_metrics: bool) -> Text:
+    """
+    One line of the detailed compute listing, assembled from pre-styled
+    segments so Rich never runs its markup parser over it.
+    """
+    line = Text.assemble(
+        " - ",
+        (inst.name, "green"),
+        f" ({inst.machine_type}) [{inst.status}]"
+        f" | Created: {inst.creation_timestamp.date().isoformat()}",
+    )
+    if inst.gpus:
+        line.append(f" | {len(inst.gpus)} GPUs")
+    line.append(f" | {len(inst.disks)} Disks | IP: {inst.internal_ip or 'N/A'}")
+    if inst.external_ip:
+        line.append(f" ({inst.external_ip})")
+
+    if inst.cpu_utilization is not None:
+        line.append(" | ")
+        line.append(
+            f"CPU: {inst.cpu_utilization:.1f}%",
+            f"bold {_cpu_color(inst.cpu_utilization)}",
+        )
+    if inst.memory_usage is not None:
+        line.append(" | ")
+        line.append(f"Mem: {inst.memory_usage:.1f}%", "bold blue")
+
+    # GPU Metrics Logic
+    if inst.gpus:
+        if inst.gpu_utilization is not None:
+            line.append(" | ")
+            line.append(f"GPU: {inst.gpu_utilization:.1f}%", "bold magenta")
+        elif include_metrics:
+            # We asked for metrics, have a GPU, but got None -> No Agent
+            line.append(" | ")
+            line.append("[No Ops Agent]", "bold red")
+
+    return line
+
 
 def print_project_detailed(
     data: dict[str, Any], console: Console, include_metrics: bool = False
@@ -275,181 +633,155 @@ def print_project_detailed(
     """Prints full resource details for a single project audit."""
     project_id = data["project_id"]
     services = data["services"]
-    console.print(
+    # Every section is collected and printed in one call: a single console
+    # lock/markup render for the whole project, however many resources
+    lines: list[RenderableType] = [
         f"\n[bold green underline]DETAILED AUDIT: {project_id}[/bold green underline]"
-    )
+    ]
 
     # 1. Compute
     if "compute" in services:
-        console.print("\n[bold]-- Compute Engine --[/bold]")
+        lines.append("\n[bold]-- Compute Engine --[/bold]")
         report = services["compute"]
 
         # Instances
-        console.print(f"Found [bold]{len(report.instances)}[/bold] instances:")
-        for inst in report.instances:
-            gpu_text = f" | {len(inst.gpus)} GPUs" if inst.gpus else ""
-            disk_text = f" | {len(inst.disks)} Disks"
-            ip_text = f" | IP: {inst.internal_ip or 'N/A'}"
-            if inst.external_ip:
-                ip_text += f" ({inst.external_ip})"
-
-            perf_text = ""
-            if inst.cpu_utilization is not None:
-                color = "green" if inst.cpu_utilization < 70 else "yellow"
-                if inst.cpu_utilization > 90:
-                    color = "red"
-                perf_text += (
-                    f" | [bold {color}]CPU: {inst.cpu_utilization:.1f}%[/bold {color}]"
-                )
-            if inst.memory_usage is not None:
-                perf_text += f" | [bold blue]Mem: {inst.memory_usage:.1f}%[/bold blue]"
-
-            # GPU Metrics Logic
-            if inst.gpus:
-                if inst.gpu_utilization is not None:
-                    perf_text += (
-                        f" | [bold magenta]GPU: {inst.gpu_utilization:.1f}%"
-                        "[/bold magenta]"
-                    )
-                elif include_metrics:
-                    # We asked for metrics, have a GPU, but got None -> No Agent
-                    perf_text += " | [bold red][No Ops Agent][/bold red]"
-
-            created_date = inst.creation_timestamp.strftime("%Y-%m-%d")
-            created_text = f" | Created: {created_date}"
-            console.print(
-                f" - [green]{inst.name}[/green] ({inst.machine_type})"
-                f" [{inst.status}]{created_text}{gpu_text}{disk_text}{ip_text}"
-                f"{perf_text}"
-            )
+        lines.append(f"Found [bold]{len(report.instances)}[/bold] instances:")
+        lines.extend(
+            _render_instance(inst, include_metrics) for inst in report.instances
+        )
 
         # Images
         if report.images:
-            console.print(f"\nFound [bold]{len(report.images)}[/bold] Custom Images:")
+            lines.append(f"\nFound [bold]{len(report.images)}[/bold] Custom Images:")
             for img in report.images:
                 size_str = (
-                    humanize.naturalsize(img.archive_size_bytes)
+                    format_size(img.archive_size_bytes)
                     if img.archive_size_bytes
                     else "Unknown"
                 )
-                console.print(
-                    f" - [cyan]{img.name}[/cyan] ({img.status}) | "
-                    f"Size: {size_str} | Disk: {img.disk_size_gb}GB"
+                lines.append(
+                    Text.assemble(
+                        " - ",
+                        (img.name, "cyan"),
+                        f" ({img.status}) | Size: {size_str}"
+                        f" | Disk: {img.disk_size_gb}GB",
+                    )
                 )
 
         # Machine Images
         if report.machine_images:
-            console.print(
+            lines.append(
                 f"\nFound [bold]{len(report.machine_images)}[/bold] Machine Images:"
             )
             for img in report.machine_images:
                 size_str = (
-                    humanize.naturalsize(img.total_storage_bytes)
+                    format_size(img.total_storage_bytes)
                     if img.total_storage_bytes
                     else "Unknown"
                 )
-                console.print(
-                    f" - [cyan]{img.name}[/cyan] ({img.status}) | Size: {size_str}"
+                lines.append(
+                    Text.assemble(
+                        " - ", (img.name, "cyan"), f" ({img.status}) | Size: {size_str}"
+                    )
                 )
 
         # Snapshots
         if report.snapshots:
-            console.print(
+            lines.append(
                 f"\nFound [bold]{len(report.snapshots)}[/bold] Disk Snapshots:"
             )
             for snap in report.snapshots:
-                size_str = humanize.naturalsize(snap.storage_bytes)
-                console.print(
-                    f" - [cyan]{snap.name}[/cyan] ({snap.status}) | "
-                    f"Size: {size_str} | Source Disk: {snap.disk_size_gb}GB"
+                size_str = format_size(snap.storage_bytes)
+                lines.append(
+                    Text.assemble(
+                        " - ",
+                        (snap.name, "cyan"),
+                        f" ({snap.status}) | Size: {size_str}"
+                        f" | Source Disk: {snap.disk_size_gb}GB",
+                    )
                 )
 
     # 2. Cloud Run
     if "run" in services:
-        console.print("\n[bold]-- Cloud Run --[/bold]")
+        lines.append("\n[bold]-- Cloud Run --[/bold]")
         run_services = services["run"]
-        console.print(f"Found [bold]{len(run_services)}[/bold] services:")
+        lines.append(f"Found [bold]{len(run_services)}[/bold] services:")
         for svc in run_services:
-            console.print(
+            lines.append(
                 f" - [cyan]{svc.name}[/cyan] ({svc.url})\n"
                 f"   Image: {svc.image}\n"
-                f"   Updated: {svc.create_time.strftime('%Y-%m-%d')} "
+                f"   Updated: {svc.create_time.date().isoformat()} "
                 f"| By: {svc.last_modifier}"
             )
 
     # 2.5 Filestore
     if "filestore" in services:
-        console.print("\n[bold]-- Filestore (NFS) --[/bold]")
+        lines.append("\n[bold]-- Filestore (NFS) --[/bold]")
         fs_instances = services["filestore"]
-        console.print(f"Found [bold]{len(fs_instances)}[/bold] instances:")
+        lines.append(f"Found [bold]{len(fs_instances)}[/bold] instances:")
         for fs in fs_instances:
             ip_str = ", ".join(fs.ip_addresses)
-            created = fs.create_time.strftime("%Y-%m-%d") if fs.create_time else "N/A"
-            console.print(
+            created = fs.create_time.date().isoformat() if fs.create_time else "N/A"
+            lines.append(
                 f" - [cyan]{fs.name}[/cyan] ({fs.tier}) [{fs.state}]\n"
                 f"   Size: {fs.capacity_gb}GB | IP: {ip_str} | Created: {created}"
             )
 
     # 3. GKE
     if "gke" in services:
-        console.print("\n[bold]-- GKE Clusters --[/bold]")
+        lines.append("\n[bold]-- GKE Clusters --[/bold]")
         clusters = services["gke"]
-        console.print(f"Found [bold]{len(clusters)}[/bold] clusters:")
+        lines.append(f"Found [bold]{len(clusters)}[/bold] clusters:")
         for cluster in clusters:
-            console.print(
+            lines.append(
                 f" - [cyan]{cluster.name}[/cyan] ({cluster.version}) [{cluster.status}]"
             )
             for np in cluster.node_pools:
-                console.print(
+                lines.append(
                     f"   └ Node Pool: [yellow]{np.name}[/yellow] "
                     f"({np.node_count} nodes, {np.machine_type})"
                 )
 
     # 4. IAM
     if "iam" in services:
-        console.print("\n[bold]-- IAM & Security --[/bold]")
+        lines.append("\n[bold]-- IAM & Security --[/bold]")
         iam_report = services["iam"]
-        console.print(f"Service Accounts: {len(iam_report.service_accounts)}")
+        lines.append(f"Service Accounts: {len(iam_report.service_accounts)}")
         for sa in iam_report.service_accounts:
             status = "[red]DISABLED[/red]" if sa.disabled else "[green]ACTIVE[/green]"
             keys_text = f" | {len(sa.keys)} Keys" if sa.keys else ""
-            console.print(f" - {sa.email} ({sa.display_name}) {status}{keys_text}")
+            lines.append(f" - {sa.email} ({sa.display_name}) {status}{keys_text}")
 
-        console.print("Policy Highlights (Privileged Roles):")
-        interesting_roles = ["roles/owner", "roles/editor", "roles/viewer"]
+        lines.append("Policy Highlights (Privileged Roles):")
+        interesting_roles = {"roles/owner", "roles/editor", "roles/viewer"}
         for binding in iam_report.policy_bindings:
             if binding.role in interesting_roles:
                 role_name = binding.role.split("/")[-1].upper()
+                users = binding.categorized_members["users"]
                 # Only show Viewers if they are Users (to avoid noise)
-                if (
-                    binding.role == "roles/viewer"
-                    and not binding.categorized_members["users"]
-                ):
+                if binding.role == "roles/viewer" and not users:
                     continue
 
-                if binding.categorized_members["users"]:
-                    console.print(f"[bold]{role_name}[/bold]:")
-                    for user in binding.categorized_members["users"]:
+                if users:
+                    lines.append(f"[bold]{role_name}[/bold]:")
+                    for user in users:
                         display_name = iam_report.user_display_names.get(user, "")
                         name_str = f" ({display_name})" if display_name else ""
-                        console.print(f" - [blue]User[/blue]: {user}{name_str}")
+                        lines.append(f" - [blue]User[/blue]: {user}{name_str}")
 
                 # Show SAs for Owner/Editor
-                if (
-                    binding.role != "roles/viewer"
-                    and binding.categorized_members["service_accounts"]
-                ):
+                if binding.role != "roles/viewer":
                     for sa in binding.categorized_members["service_accounts"]:
-                        console.print(f" - [magenta]ServiceAccount[/magenta]: {sa}")
+                        lines.append(f" - [magenta]ServiceAccount[/magenta]: {sa}")
 
     # 5. SQL
     if "sql" in services:
-        console.print("\n[bold]-- Cloud SQL --[/bold]")
+        lines.append("\n[bold]-- Cloud SQL --[/bold]")
         sql_instances = services["sql"]
-        console.print(f"Found [bold]{len(sql_instances)}[/bold] instances:")
+        lines.append(f"Found [bold]{len(sql_instances)}[/bold] instances:")
         for db in sql_instances:
             ip_info = f" | IP: {db.public_ip or db.private_ip or 'None'}"
-            console.print(
+            lines.append(
                 f" - [cyan]{db.name}[/cyan] ({db.database_version} | "
                 f"{db.tier}) [{db.status}]{ip_info} | "
                 f"{db.storage_limit_gb}GB"
@@ -457,50 +789,68 @@ def print_project_detailed(
 
     # 6. Vertex
     if "vertex" in services:
-        console.print("\n[bold]-- Vertex AI --[/bold]")
+        lines.append("\n[bold]-- Vertex AI --[/bold]")
         vtx = services["vertex"]
         if vtx.notebooks:
-            console.print(f"Found [bold]{len(vtx.notebooks)}[/bold] Notebooks:")
+            lines.append(f"Found [bold]{len(vtx.notebooks)}[/bold] Notebooks:")
             for nb in vtx.notebooks:
-                console.print(
+                lines.append(
                     f" - [cyan]{nb.display_name}[/cyan] ({nb.state}) | {nb.creator}"
                 )
         if vtx.endpoints:
-            console.print(f"Found [bold]{len(vtx.endpoints)}[/bold] Endpoints:")
+            lines.append(f"Found [bold]{len(vtx.endpoints)}[/bold] Endpoints:")
             for ep in vtx.endpoints:
-                console.print(
+                lines.append(
                     f" - [cyan]{ep.display_name}[/cyan] (Location: {ep.location})"
                 )
 
     # 7. Network
     if "network" in services:
-        console.print("\n[bold]-- Network --[/bold]")
+        lines.append("\n[bold]-- Network --[/bold]")
         net = services["network"]
-        console.print(f"Firewalls: {len(net.firewalls)}")
+        lines.append(f"Firewalls: {len(net.firewalls)}")
         for fw in net.firewalls:
             if "0.0.0.0/0" in fw.source_ranges:
-                console.print(
+                lines.append(
                     f" - [bold red]OPEN[/bold red] {fw.name} "
                     f"({fw.direction}) -> {fw.allowed_ports}"
                 )
 
     # 8. Storage
     if "storage" in services:
-        console.print("\n[bold]-- Cloud Storage --[/bold]")
+        lines.append("\n[bold]-- Cloud Storage --[/bold]")
         buckets = services["storage"]
-        console.print(f"Found [bold]{len(buckets)}[/bold] buckets:")
+        lines.append(f"Found [bold]{len(buckets)}[/bold] buckets:")
         for b in buckets:
-            size_str = humanize.naturalsize(b.size_bytes) if b.size_bytes else "0 Bytes"
+            size_str = format_size(b.size_bytes) if b.size_bytes else "0 Bytes"
             pap = (
                 f"[green]{b.public_access_prevention}[/green]"
                 if b.public_access_prevention == "enforced"
                 else f"[red]{b.public_access_prevention}[/red]"
             )
-            console.print(
+            lines.append(
                 f" - [cyan]{b.name}[/cyan] ({b.location}) | "
                 f"Size: {size_str} | PAP: {pap}"
             )
 
+    console.print(*lines, sep="\n")
+
+
+class _NullProgress:
+    """Stand-in for rich Progress that renders nothing (used for --json)."""
+
+    def __enter__(self) -> "_NullProgress":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+    def add_task(self, *_args: Any, **_kwargs: Any) -> TaskID:
+        return TaskID(0)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
 
 def run_fleet_audit(
     args: Any,
@@ -512,28 +862,25 @@ def run_fleet_audit(
     # 1. Discover Projects
     target_projects = []
     if args.all_projects:
+        from ..walkers import org
+
         log_console.print("Discovering ACTIVE projects...")
         target_projects = org.list_all_projects()
         log_console.print(f"Found [bold]{len(target_projects)}[/bold] projects.")
     else:
         target_projects = [args.project_id]
 
-    services = args.services
-    if "all" in services:
-        services = [
-            "compute",
-            "storage",
-            "gke",
-            "vertex",
-            "sql",
-            "filestore",
-            "iam",
-            "run",
-            "network",
-        ]
+    services = ALL_SERVICES if "all" in args.services else frozenset(args.services)
+
+    # Build shared clients once before any scans are submitted
+    prewarm_clients(services)
 
     # 2. Batch Execution
+    # Reports are printed/streamed as projects finish; they only need to be
+    # kept around when a PDF/HTML report is rendered at the end.
+    keep_reports = bool(args.report or args.html)
     all_reports = []
+    json_stream = JsonReportStream(sys.stdout.buffer) if args.json else None
     if len(target_projects) == 1:
         # Single project: no progress bar, full details
         pid = target_projects[0]
@@ -541,96 +888,178 @@ def run_fleet_audit(
             result = run_audit_for_project(
                 pid, services, args.regions, out_console, args.metrics
             )
-            all_reports.append(result)
-            if not args.json:
+            if keep_reports:
+                all_reports.append(result)
+            if json_stream:
+                json_stream.write(result)
+            else:
                 print_project_detailed(result, out_console, args.metrics)
         except Exception as e:
             log_console.print(
                 f"[bold red]Failed to audit project {pid}:[/bold red] {e}"
             )
+        finally:
+            if json_stream:
+                json_stream.close()
     else:
         # Multi-project: progress bar, summary output
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=log_console,
-        ) as progress:
+        # --json output is piped; don't run a live display nobody sees
+        progress_ctx = (
+            _NullProgress()
+            if args.json
+            else Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+                console=log_console,
+            )
+        )
+        with progress_ctx as progress:
             task = progress.add_task("Auditing projects...", total=len(target_projects))
 
-            executor = ThreadPoolExecutor(max_workers=args.concurrency)
-            futures = {}
+            # Every (project, service, location) scan shares one bounded pool.
+            # Projects are admitted in a sliding window of --concurrency so
+            # only that many projects' partial results are held at once.
+            executor = ThreadPoolExecutor(
+                max_workers=min(
+                    max(1, args.concurrency) * SCAN_WORKERS_PER_PROJECT,
+                    MAX_SCAN_WORKERS,
+                )
+            )
+            # One thread owns stdout, so project outputs stay in completion
+            # order and never interleave.
+            render_pool = ThreadPoolExecutor(max_workers=1)
+            future_to_task: dict[Future[Any], tuple[str, str]] = {}
+            pending: dict[str, int] = {}
+            partials: dict[str, dict[str, list[Any]]] = {}
+            failed: set[str] = set()
+            queue = iter(target_projects)
+
+            def admit_next() -> list[Future[Any]]:
+                """Queues planning (region discovery) of the next project."""
+                pid = next(queue, None)
+                if pid is None:
+                    return []
+                pending[pid] = 1
+                partials[pid] = defaultdict(list)
+                future = executor.submit(
+                    plan_project_scans,
+                    pid,
+                    services,
+                    args.regions,
+                    log_console,
+                    args.metrics,
+                )
+                future_to_task[future] = (pid, PLAN_TASK)
+                return [future]
+
+            def submit_scans(
+                pid: str, tasks: list[tuple[str, Callable[[], Any]]]
+            ) -> list[Future[Any]]:
+                """Submits a planned project's scans to the shared pool."""
+                pending[pid] += len(tasks)
+                futures = []
+                for svc, fn in tasks:
+                    future = executor.submit(fn)
+                    future_to_task[future] = (pid, svc)
+                    futures.append(future)
+                return futures
+
+            def report_render_failure(pid: str, future: Future[None]) -> None:
+                """Surfaces a project whose output could not be rendered."""
+                if future.cancelled() or future.exception() is None:
+                    return
+                failed.add(pid)
+                log_console.print(
+                    f"[bold red]Failed to audit project {pid}:[/bold red] "
+                    f"{future.exception()}"
+                )
+
             try:
-                futures = {
-                    executor.submit(
-                        run_audit_for_project,
-                        pid,
-                        services,
-                        args.regions,
-                        log_console,
-                        args.metrics,
-                    ): pid
-                    for pid in target_projects
-                }
-
-                for future in as_completed(futures):
-                    project_id = futures[future]
-                    try:
-                        result = future.result()
-                        all_reports.append(result)
-
-                        # Output Logic (Summary for fleet)
-                        if not args.json:
-                            print_project_summary(result, out_console)
-
-                    except Exception as e:
-                        log_console.print(
-                            f"[bold red]Failed to audit project {project_id}:"
-                            f"[/bold red] {e}"
-                        )
-                    progress.update(task, advance=1)
+                in_flight: set[Future[Any]] = set()
+                for _ in range(max(1, args.concurrency)):
+                    in_flight.update(admit_next())
+
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        project_id, svc = future_to_task.pop(future)
+                        try:
+                            result = future.result()
+                            if svc == PLAN_TASK:
+                                in_flight.update(submit_scans(project_id, result))
+                            else:
+                                partials[project_id][svc].append(result)
+                        except Exception as e:
+                            if isinstance(e, FATAL_ERRORS):
+                                # Every other project would fail the same way
+                                executor.shutdown(wait=False, cancel_futures=True)
+                                raise
+                            if project_id not in failed:
+                                failed.add(project_id)
+                                log_console.print(
+                                    f"[bold red]Failed to audit project "
+                                    f"{project_id}:[/bold red] {e}"
+                                )
+
+                        # A project is complete once all of its scans returned
+                        pending[project_id] -= 1
+                        if pending[project_id]:
+                            continue
+
+                        del pending[project_id]
+                        project_results = partials.pop(project_id)
+                        if project_id not in failed:
+                            report = build_project_report(
+                                project_id, services, project_results
+                            )
+                            if keep_reports:
+                                all_reports.append(report)
+
+                            # Output Logic (Summary for fleet), rendered off
+                            # the dispatch loop so it can keep admitting work
+                            if json_stream:
+                                rendered = render_pool.submit(json_stream.write, report)
+                            else:
+                                rendered = render_pool.submit(
+                                    print_project_summary, report, out_console
+                                )
+                            rendered.add_done_callback(
+                                partial(report_render_failure, project_id)
+                            )
+                        progress.update(task, advance=1)
+
+                        # Free slot: start the next project
+                        in_flight.update(admit_next())
             except KeyboardInterrupt:
                 log_console.print("\n[bold red]Cancelling audit...[/bold red]")
                 executor.shutdown(wait=False, cancel_futures=True)
+                render_pool.shutdown(wait=False, cancel_futures=True)
                 sys.exit(130)
             finally:
-                # Ensure executor is cleaned up if we exit normally
+                # Ensure executors are cleaned up (and output flushed) if we
+                # exit normally
                 executor.shutdown(wait=True)
+                render_pool.shutdown(wait=True)
+                # Terminate the array even when a fatal error aborts the
+                # fleet, so --json output stays valid
+                if json_stream:
+                    json_stream.close()
 
     # 3. Handle Outputs
-    if args.json:
-        # Serialize list of reports
-        json_output = []
-        for report in all_reports:
-            entry = {
-                "project_id": report["project_id"],
-                "scan_time": report["scan_time"].isoformat(),
-                "services": {},
-            }
-            for svc_name, items in report["services"].items():
-                if isinstance(items, list):
-                    entry["services"][svc_name] = [
-                        item.model_dump(mode="json") for item in items
-                    ]
-                else:
-                    # Single object (like GCPIAMReport or GCPVertexReport)
-                    entry["services"][svc_name] = items.model_dump(mode="json")
-            json_output.append(entry)
-        print(json.dumps(json_output, indent=2))
-
     if args.report or args.html:
         log_console.print("\n[bold]Generating reports...[/bold]")
         try:
-            from ..reporter import generate_compliance_report
+            from ..reporter import render_compliance_report, write_report
 
+            # Render the template once for both output formats
+            html_content = render_compliance_report(all_reports)
             if args.report:
-                generate_compliance_report(
-                    all_reports, args.report, output_format="pdf"
-                )
+                write_report(html_content, args.report, output_format="pdf")
             if args.html:
-                generate_compliance_report(all_reports, args.html, output_format="html")
+                write_report(html_content, args.html, output_format="html")
             log_console.print("[green]Reports generated successfully.[/green]")
         except Exception as e:
             log_console.print(f"[bold red]Failed to generate reports: {e}[/bold red]")
@@ -1,5 +1,4 @@
 import argparse
-import contextlib
 import subprocess
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
@@ -9,6 +8,7 @@ from rich.markup import escape
 from rich.prompt import Confirm
 from rich.table import Table
 
+from ..core import DEFAULT_SCOPING_PROJECT
 from ..logger import logger
 from ..walkers import monitoring
 
@@ -65,7 +65,7 @@ def _fix_ops_agent(args: argparse.Namespace, console: Console) -> None:
 
     # 1. Discovery
     console.print("Scanning fleet for missing agents...")
-    scoping_proj = args.scoping_project or "ucr-research-computing"
+    scoping_proj = args.scoping_project or DEFAULT_SCOPING_PROJECT
 
     try:
         metrics = monitoring.fetch_fleet_metrics(scoping_proj)
@@ -83,18 +83,10 @@ def _fix_ops_agent(args: argparse.Namespace, console: Console) -> None:
     # We need to resolve names.
     from ..walkers import asset
 
-    projects_to_scan = {m.get("project_id") for m in metrics if m.get("project_id")}
+    projects_to_scan = {m["project_id"] for m in metrics if m.get("project_id")}
     console.print(f"Resolving names for {len(projects_to_scan)} projects...")
 
-    assets = {}
-    with ThreadPoolExecutor(max_workers=20) as executor:
-        futures = {
-            executor.submit(asset.search_all_instances, f"projects/{pid}"): pid
-            for pid in projects_to_scan
-        }
-        for future in as_completed(futures):
-            with contextlib.suppress(Exception):
-                assets.update(future.result())
+    assets = asset.search_project_instances(projects_to_scan)
 
     # Now filter
     for m in metrics:
@@ -155,8 +147,8 @@ def _fix_ops_agent(args: argparse.Namespace, console: Console) -> None:
         install_futures: list[Future[str]] = [
             executor.submit(_install_agent, c) for c in candidates
         ]
-        for future in as_completed(install_futures):
-            console.print(future.result())
+        for install_future in as_completed(install_futures):
+            console.print(install_future.result())
 
 
 def run_fix(
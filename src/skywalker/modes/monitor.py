@@ -1,17 +1,16 @@
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
 from datetime import datetime
-from pathlib import Path
 
-import jinja2
+import orjson
 import pandas as pd
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
+from ..core import DEFAULT_SCOPING_PROJECT
 from ..walkers import asset, monitoring
 
-DEFAULT_SCOPING_PROJECT = "ucr-research-computing"
-
 
 def run_fleet_monitor(
     args: argparse.Namespace, log_console: Console, out_console: Console
@@ -31,7 +30,7 @@ def run_fleet_monitor(
 
         # 2. Identify Projects to Scan
         projects_to_scan = {
-            m.get("project_id") for m in metrics_data if m.get("project_id")
+            m["project_id"] for m in metrics_data if m.get("project_id")
         }
 
         log_console.print(
@@ -51,38 +50,24 @@ def run_fleet_monitor(
                 # Fallback logic below...
 
         if not assets:
-            with ThreadPoolExecutor(max_workers=20) as executor:
-                # Submit asset search for each project
-                futures = {
-                    executor.submit(asset.search_all_instances, f"projects/{pid}"): pid
-                    for pid in projects_to_scan
-                }
-
-                for future in as_completed(futures):
-                    try:
-                        project_assets = future.result()
-                        assets.update(project_assets)
-                    except Exception:
-                        pass  # Ignore failures for individual projects
-
-        # 3. Enrich Data
-        enriched_data = []
-        for m in metrics_data:
-            iid = str(m.get("instance_id", ""))
-            if iid and iid in assets:
-                m["instance_name"] = assets[iid]["name"]
-                m["machine_type"] = assets[iid]["machine_type"]
-            else:
-                m["instance_name"] = "unknown"
-                m["machine_type"] = "unknown"
-            enriched_data.append(m)
-
-        df = pd.DataFrame(enriched_data)
+            assets = asset.search_project_instances(projects_to_scan)
+
+        # 3. Enrich Data: one left join against the inventory
+        df = pd.DataFrame(metrics_data)
 
         if df.empty:
             log_console.print("[yellow]No metrics found in scope.[/yellow]")
             return
 
+        inventory = pd.DataFrame.from_dict(
+            assets, orient="index", columns=["name", "machine_type"]
+        ).rename(columns={"name": "instance_name"})
+        df["instance_id"] = df["instance_id"].astype(str)
+        df = df.merge(inventory, how="left", left_on="instance_id", right_index=True)
+        df[["instance_name", "machine_type"]] = df[
+            ["instance_name", "machine_type"]
+        ].fillna("unknown")
+
         # Console Output (Rich Table)
         if not args.json:
             table = Table(title="Fleet Top Consumers")
@@ -93,49 +78,58 @@ def run_fleet_monitor(
             table.add_column("Mem %", justify="right")
             table.add_column("GPU Util %", justify="right")
 
-            # Sort by CPU desc (treat NaN as 0 for sorting)
-            top_cpu = df.sort_values(
-                by="cpu_percent", ascending=False, na_position="last"
-            ).head(args.limit)
+            # Top consumers by CPU: a partial sort, with instances lacking CPU
+            # data filling any remaining rows (as they sort last)
+            top_cpu = df.nlargest(args.limit, "cpu_percent")
+            if len(top_cpu) < args.limit:
+                no_cpu = df[df["cpu_percent"].isna()]
+                top_cpu = pd.concat([top_cpu, no_cpu.head(args.limit - len(top_cpu))])
 
-            for _, row in top_cpu.iterrows():
+            # Cells are pre-styled Text, so Rich never parses them as markup
+            na = Text("N/A", style="dim")
+            for row in top_cpu.itertuples(index=False):
                 # CPU
-                if pd.notna(row.get("cpu_percent")):
-                    cpu_val = row["cpu_percent"]
-                    cpu_style = "red" if cpu_val > 90 else "white"
-                    cpu_str = f"[{cpu_style}]{cpu_val:.1f}%[/{cpu_style}]"
+                cpu_val = getattr(row, "cpu_percent", None)
+                if pd.notna(cpu_val):
+                    cpu_cell = Text(
+                        f"{cpu_val:.1f}%", style="red" if cpu_val > 90 else "white"
+                    )
                 else:
-                    cpu_str = "[dim]N/A[/dim]"
+                    cpu_cell = na
 
                 # Memory
-                if pd.notna(row.get("memory_percent")):
-                    mem_val = row["memory_percent"]
-                    mem_str = f"{mem_val:.1f}%"
-                else:
-                    mem_str = "[dim]N/A[/dim]"
+                mem_val = getattr(row, "memory_percent", None)
+                mem_cell = Text(f"{mem_val:.1f}%") if pd.notna(mem_val) else na
 
                 # GPU
-                if pd.notna(row.get("gpu_utilization")):
-                    gpu_val = row["gpu_utilization"]
-                    gpu_style = "magenta" if gpu_val > 0 else "dim"
-                    gpu_str = f"[{gpu_style}]{gpu_val:.1f}%[/{gpu_style}]"
+                gpu_val = getattr(row, "gpu_utilization", None)
+                if pd.notna(gpu_val):
+                    gpu_cell = Text(
+                        f"{gpu_val:.1f}%", style="magenta" if gpu_val > 0 else "dim"
+                    )
                 else:
-                    gpu_str = "[dim]-[/dim]"
+                    gpu_cell = Text("-", style="dim")
 
                 table.add_row(
-                    str(row["project_id"]),
-                    str(row["instance_name"]),
-                    str(row["machine_type"]),
-                    cpu_str,
-                    mem_str,
-                    gpu_str,
+                    Text(str(row.project_id)),
+                    Text(str(row.instance_name)),
+                    Text(str(row.machine_type)),
+                    cpu_cell,
+                    mem_cell,
+                    gpu_cell,
                 )
             out_console.print(table)
             out_console.print(f"\nTotal Instances Monitored: [bold]{len(df)}[/bold]")
 
         # JSON Output
         if args.json:
-            print(df.to_json(orient="records"))
+            sys.stdout.buffer.write(
+                orjson.dumps(
+                    df.to_dict(orient="records"),
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE,
+                )
+            )
+            sys.stdout.buffer.flush()
 
         # CSV Output
         if args.csv:
@@ -144,20 +138,20 @@ def run_fleet_monitor(
 
         # HTML Report (if requested)
         if args.html:
-            template_dir = Path(__file__).parent.parent / "templates"
-            env = jinja2.Environment(
-                loader=jinja2.FileSystemLoader(str(template_dir)),
-                autoescape=jinja2.select_autoescape(["html", "xml"]),
-            )
-            template = env.get_template("fleet_performance.html")
-            html_content = template.render(
-                data=enriched_data,
+            from ..reporter import get_template
+
+            template = get_template("fleet_performance.html")
+            # Drop missing metrics so the template's `is defined` checks hold
+            records = [
+                {k: v for k, v in record.items() if pd.notna(v)}
+                for record in df.to_dict(orient="records")
+            ]
+            # Stream rendered chunks straight to disk
+            template.stream(
+                data=records,
                 scoping_project=scoping_proj,
                 scan_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            )
-
-            with Path(args.html).open("w") as f:
-                f.write(html_content)
+            ).dump(args.html, encoding="utf-8")
             log_console.print(f"Report saved to [bold]{args.html}[/bold]")
 
     except Exception as e:
@@ -1,20 +1,36 @@
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import atexit
+import csv
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-import pandas as pd
+import orjson
 from rich.console import Console
 from rich.table import Table
 
 from ..clients import get_disks_client
+from ..core import DEFAULT_SCOPING_PROJECT, MAX_SCAN_WORKERS
 from ..logger import logger
 from ..walkers import monitoring, network, storage
 
+BUCKET_EGRESS_METRIC = "storage.googleapis.com/network/sent_bytes_count"
 
-@dataclass
+
+# Rough monthly $/GB by disk type; anything else is priced as pd-standard
+_DEFAULT_DISK_RATE = 0.04
+_DISK_RATE = {
+    "pd-standard": _DEFAULT_DISK_RATE,
+    "pd-ssd": 0.17,
+    "pd-balanced": 0.10,
+    "hyperdisk-balanced": 0.10,
+    "hyperdisk-balanced-high-availability": 0.10,
+}
+
+
+@dataclass(slots=True)
 class ZombieResource:
     resource_type: str
     project_id: str
@@ -25,12 +41,23 @@ class ZombieResource:
 
 
 class ZombieHunter:
-    def __init__(self, console: Console):
+    """
+    Each hunt returns its own findings rather than appending to shared
+    state, so hunts can run on any number of threads without a lock.
+    """
+
+    def __init__(
+        self,
+        console: Console,
+        bucket_activity: dict[str, dict[str, float]] | None = None,
+    ):
         self.console = console
-        self.zombies: list[ZombieResource] = []
+        # Bucket egress prefetched for a whole metrics scope, by project
+        self.bucket_activity = bucket_activity or {}
 
-    def hunt_disks(self, project_id: str) -> None:
+    def hunt_disks(self, project_id: str) -> list[ZombieResource]:
         """Finds orphaned disks (not attached to any user)."""
+        zombies = []
         try:
             client = get_disks_client()
             for _zone, disks in client.aggregated_list(project=project_id):
@@ -40,16 +67,11 @@ class ZombieHunter:
                     if not disk.users:
                         # Orphan!
                         size = disk.size_gb
-                        disk_type = disk.type_.split("/")[-1]  # pd-standard, pd-ssd
+                        # .../diskTypes/pd-standard -> pd-standard
+                        disk_type = disk.type_.rpartition("/")[2]
+                        cost = size * _DISK_RATE.get(disk_type, _DEFAULT_DISK_RATE)
 
-                        # Rough cost: Standard $0.04, SSD $0.17
-                        cost = size * 0.04
-                        if "ssd" in disk_type:
-                            cost = size * 0.17
-                        elif "balanced" in disk_type:
-                            cost = size * 0.10
-
-                        self.zombies.append(
+                        zombies.append(
                             ZombieResource(
                                 resource_type="Disk",
                                 project_id=project_id,
@@ -61,19 +83,21 @@ class ZombieHunter:
                         )
         except Exception as e:
             logger.debug(f"Failed to hunt disks in {project_id}: {e}")
+        return zombies
 
-    def hunt_ips(self, project_id: str) -> None:
+    def hunt_ips(self, project_id: str) -> list[ZombieResource]:
         """Finds unused static IPs."""
+        zombies = []
         try:
-            report = network.get_network_report(project_id)
-            for addr in report.addresses:
+            # Only addresses matter here, not the firewall/VPC/subnet scan
+            for addr in network.list_addresses(project_id):
                 # Only care about EXTERNAL IPs costing money
                 if (
                     addr.status == "RESERVED"
                     and not addr.user
                     and addr.address_type == "EXTERNAL"
                 ):
-                    self.zombies.append(
+                    zombies.append(
                         ZombieResource(
                             resource_type="Static IP",
                             project_id=project_id,
@@ -85,22 +109,26 @@ class ZombieHunter:
                     )
         except Exception as e:
             logger.debug(f"Failed to hunt IPs in {project_id}: {e}")
+        return zombies
 
-    def hunt_buckets(self, project_id: str) -> None:
+    def hunt_buckets(self, project_id: str) -> list[ZombieResource]:
         """Finds inactive buckets (Zero IO for 30 days)."""
+        zombies: list[ZombieResource] = []
         try:
             buckets = storage.list_buckets(project_id)
             if not buckets:
-                return
-
-            # Fetch activity
-            activity = monitoring.fetch_inactive_resources(
-                project_id,
-                metric_type="storage.googleapis.com/network/sent_bytes_count",
-                resource_type="gcs_bucket",
-                days=30,
-                group_by=["resource.label.bucket_name"],
-            )
+                return zombies
+
+            # Fetch activity, unless the scope-wide query already covered it
+            activity = self.bucket_activity.get(project_id)
+            if activity is None:
+                activity = monitoring.fetch_inactive_resources(
+                    project_id,
+                    metric_type=BUCKET_EGRESS_METRIC,
+                    resource_type="gcs_bucket",
+                    days=30,
+                    group_by=["resource.label.bucket_name"],
+                )
 
             for b in buckets:
                 # If total sent bytes is 0 (or very low < 1MB), call it a zombie
@@ -112,7 +140,7 @@ class ZombieHunter:
 
                     cost = size_gb * 0.02
 
-                    self.zombies.append(
+                    zombies.append(
                         ZombieResource(
                             resource_type="Bucket",
                             project_id=project_id,
@@ -124,38 +152,63 @@ class ZombieHunter:
                     )
         except Exception as e:
             logger.debug(f"Failed to hunt buckets in {project_id}: {e}")
+        return zombies
 
 
-def run_zombie_hunt(args: Any, log_console: Console, out_console: Console) -> None:
-    hunter = ZombieHunter(log_console)
+# WeasyPrint runs on one long-lived background thread, so the PDF is laid out
+# while the rest of the command finishes; it is joined before the process exits.
+_report_pool = ThreadPoolExecutor(max_workers=1)
+atexit.register(_report_pool.shutdown, wait=True)
+
+
+def _log_pdf_result(future: Future[None], path: str, log_console: Console) -> None:
+    try:
+        future.result()
+        log_console.print(f"PDF Report saved to [bold]{path}[/bold]")
+    except ImportError:
+        log_console.print("[red]PDF Generation requires 'weasyprint'. skipping.")
+    except Exception as e:
+        log_console.print(f"[bold red]Failed to generate PDF report:[/bold red] {e}")
+
 
+def run_zombie_hunt(args: Any, log_console: Console, out_console: Console) -> None:
     # 1. Scope
     projects = []
+    bucket_activity = None
     if args.all_projects:
         from ..walkers import org
 
         projects = org.list_all_projects()
+        # One scope-wide query for bucket egress instead of one per project.
+        # Projects it does not cover fall back to their own query.
+        bucket_activity = monitoring.fetch_inactive_resources_by_project(
+            args.scoping_project or DEFAULT_SCOPING_PROJECT,
+            metric_type=BUCKET_EGRESS_METRIC,
+            resource_type="gcs_bucket",
+            label="bucket_name",
+            days=30,
+        )
     else:
         projects = [args.project_id]
 
+    hunter = ZombieHunter(log_console, bucket_activity)
     log_console.print(f"Hunting Zombies across {len(projects)} projects...")
 
-    # 2. Parallel Hunt
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = []
-        for pid in projects:
-            futures.append(executor.submit(hunter.hunt_disks, pid))
-            futures.append(executor.submit(hunter.hunt_ips, pid))
-            futures.append(executor.submit(hunter.hunt_buckets, pid))
+    # 2. Parallel Hunt: --concurrency projects' worth of hunts in flight
+    hunts = (hunter.hunt_disks, hunter.hunt_ips, hunter.hunt_buckets)
+    zombies: list[ZombieResource] = []
+    workers = min(max(1, args.concurrency) * len(hunts), MAX_SCAN_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(hunt, pid) for pid in projects for hunt in hunts]
 
         for future in as_completed(futures):
             try:
-                future.result()
+                zombies.extend(future.result())
             except Exception as e:
                 logger.debug(f"Hunter task failed: {e}")
 
     # 3. Report
-    if not hunter.zombies:
+    if not zombies:
         if not args.json:
             out_console.print("[green]No Zombies Found! Fleet is clean.[/green]")
         else:
@@ -163,12 +216,8 @@ def run_zombie_hunt(args: Any, log_console: Console, out_console: Console) -> No
         return
 
     # Sort by cost desc
-    hunter.zombies.sort(key=lambda z: z.monthly_cost_est, reverse=True)
-    total_waste = sum(z.monthly_cost_est for z in hunter.zombies)
-
-    # Prepare data for non-terminal outputs
-    zombie_dicts = [asdict(z) for z in hunter.zombies]
-    df = pd.DataFrame(zombie_dicts)
+    zombies.sort(key=attrgetter("monthly_cost_est"), reverse=True)
+    total_waste = sum(z.monthly_cost_est for z in zombies)
 
     # Console Output (Table)
     if not args.json:
@@ -180,7 +229,7 @@ def run_zombie_hunt(args: Any, log_console: Console, out_console: Console) -> No
         table.add_column("Est. Cost/Mo", justify="right")
         table.add_column("Reason", style="dim")
 
-        for z in hunter.zombies:
+        for z in zombies:
             table.add_row(
                 z.resource_type,
                 z.project_id,
@@ -193,80 +242,39 @@ def run_zombie_hunt(args: Any, log_console: Console, out_console: Console) -> No
 
     # JSON Output
     if args.json:
-        print(json.dumps(zombie_dicts, indent=2))
+        # orjson encodes the dataclasses natively, without asdict() copies
+        options = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        sys.stdout.buffer.write(orjson.dumps(zombies, option=options))
+        sys.stdout.buffer.flush()
 
     # CSV Output
     if args.csv:
-        df.to_csv(args.csv, index=False)
+        with Path(args.csv).open("w", newline="") as f:
+            columns = [fd.name for fd in fields(ZombieResource)]
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(asdict(z) for z in zombies)
         log_console.print(f"Zombie data saved to [bold]{args.csv}[/bold]")
 
     # HTML/PDF Report (reuse or generate)
     if args.html or args.report:
         log_console.print("\n[bold]Generating Zombie Hunter reports...[/bold]")
         try:
-            scan_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            html_content = f"""
-            <html>
-            <head><title>Zombie Hunter Report</title><style>
-            @page {{ size: A4 landscape; margin: 1cm; }}
-            body {{ font-family: sans-serif; font-size: 10pt; }}
-            table {{ 
-                border-collapse: collapse; 
-                width: 100%; 
-                table-layout: fixed; /* Enforce column widths */
-            }}
-            th, td {{ 
-                text-align: left; 
-                padding: 6px; 
-                border-bottom: 1px solid #ddd; 
-                word-wrap: break-word; /* Wrap long text like IDs */
-                overflow-wrap: break-word;
-            }}
-            tr:nth-child(even) {{ background-color: #f2f2f2; }}
-            th {{ background-color: #f44336; color: white; }}
-            .summary {{ background: #eee; padding: 15px; margin-bottom: 20px; }}
-            
-            /* Column Sizing Guide */
-            th:nth-child(1) {{ width: 8%; }}  /* Type */
-            th:nth-child(2) {{ width: 20%; }} /* Project */
-            th:nth-child(3) {{ width: 20%; }} /* Name */
-            th:nth-child(4) {{ width: 25%; }} /* Details */
-            th:nth-child(5) {{ width: 10%; }} /* Cost */
-            th:nth-child(6) {{ width: 17%; }} /* Reason */
-            </style></head>
-            <body>
-            <h1>🧟 Skywalker Zombie Hunter Report</h1>
-            <div class="summary">
-                <p><strong>Scan Time:</strong> {scan_time}</p>
-                <p><strong>Total Zombies Found:</strong> {len(hunter.zombies)}</p>
-                <p><strong>Total Estimated Waste:</strong> ${total_waste:.2f}/month</p>
-            </div>
-            <table>
-                <tr><th>Type</th><th>Project</th><th>Name</th><th>Details</th>
-                <th>Est. Cost/Mo</th><th>Reason</th></tr>
-            """
-            for z in hunter.zombies:
-                html_content += (
-                    f"<tr><td>{z.resource_type}</td><td>{z.project_id}</td>"
-                    f"<td>{z.name}</td><td>{z.details}</td>"
-                    f"<td>${z.monthly_cost_est:.2f}</td><td>{z.reason}</td></tr>"
+            from ..reporter import render_zombie_report, write_report
+
+            html_content = render_zombie_report(zombies, total_waste)
+
+            if args.report:
+                pdf_path = args.report
+                pdf_future = _report_pool.submit(
+                    write_report, html_content, pdf_path, "pdf"
+                )
+                pdf_future.add_done_callback(
+                    lambda f: _log_pdf_result(f, pdf_path, log_console)
                 )
-            html_content += "</table></body></html>"
 
             if args.html:
-                with Path(args.html).open("w") as f:
-                    f.write(html_content)
+                write_report(html_content, args.html, "html")
                 log_console.print(f"HTML Report saved to [bold]{args.html}[/bold]")
-
-            if args.report:
-                try:
-                    from weasyprint import HTML
-
-                    HTML(string=html_content).write_pdf(args.report)
-                    log_console.print(f"PDF Report saved to [bold]{args.report}[/bold]")
-                except ImportError:
-                    log_console.print(
-                        "[red]PDF Generation requires 'weasyprint'. skipping."
-                    )
         except Exception as e:
             log_console.print(f"[bold red]Failed to generate report:[/bold red] {e}")
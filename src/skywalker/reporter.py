@@ -1,21 +1,15 @@
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
 
-import humanize
 import jinja2
-from weasyprint import HTML
 
+from .core import format_size
 
-def generate_compliance_report(
-    report_data: list[dict[str, Any]],
-    output_path: str,
-    output_format: Literal["html", "pdf"] = "pdf",
-) -> None:
-    """
-    Generates a consolidated audit report for multiple projects.
-    """
-    # Setup Jinja2 environment
+
+def _build_env() -> jinja2.Environment:
+    """Jinja2 environment over the bundled templates, with the report filters."""
     template_dir = Path(__file__).parent / "templates"
     env = jinja2.Environment(
         loader=jinja2.FileSystemLoader(str(template_dir)),
@@ -26,7 +20,7 @@ def generate_compliance_report(
     def humanize_size_filter(v: int | None) -> str:
         if not v:
             return "0 Bytes"
-        return str(humanize.naturalsize(v))
+        return format_size(v)
 
     def format_date(value: Any) -> str:
         if isinstance(value, str):
@@ -37,15 +31,65 @@ def generate_compliance_report(
 
     env.filters["humanize_size"] = humanize_size_filter
     env.filters["format_date"] = format_date
+    return env
+
 
-    # Render HTML
-    template = env.get_template("report.html")
-    html_content = template.render(
+# Built once per process; Jinja2 keeps each template compiled after first use
+_ENV = _build_env()
+
+
+def get_template(name: str) -> jinja2.Template:
+    """Returns a bundled template, compiled on first use only."""
+    return _ENV.get_template(name)
+
+
+def render_compliance_report(report_data: list[dict[str, Any]]) -> str:
+    """
+    Renders the consolidated audit report for multiple projects to HTML.
+    """
+    template = get_template("report.html")
+    return template.render(
         report_data=report_data, scan_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     )
 
+
+def render_zombie_report(zombies: Sequence[Any], total_waste: float) -> str:
+    """
+    Renders the Zombie Hunter findings (most expensive first) to HTML.
+    """
+    template = get_template("zombies.html")
+    return template.render(
+        zombies=zombies,
+        total_waste=total_waste,
+        scan_time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    )
+
+
+def write_report(
+    html_content: str,
+    output_path: str,
+    output_format: Literal["html", "pdf"] = "pdf",
+) -> None:
+    """
+    Writes an already rendered report (compliance or zombie), so PDF and HTML
+    outputs share one render.
+    """
     if output_format == "html":
         Path(output_path).write_text(html_content, encoding="utf-8")
     else:
-        # Generate PDF
+        # Generate PDF. WeasyPrint (and its Cairo/Pango bindings) is only
+        # loaded here, so HTML-only reports never pay for it.
+        from weasyprint import HTML
+
         HTML(string=html_content).write_pdf(output_path)
+
+
+def generate_compliance_report(
+    report_data: list[dict[str, Any]],
+    output_path: str,
+    output_format: Literal["html", "pdf"] = "pdf",
+) -> None:
+    """
+    Generates a consolidated audit report for multiple projects.
+    """
+    write_report(render_compliance_report(report_data), output_path, output_format)
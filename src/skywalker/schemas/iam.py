@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -23,7 +24,7 @@ class GCPPolicyBinding(BaseModel):
     role: str
     members: list[str]
 
-    @property
+    @cached_property
     def categorized_members(self) -> dict[str, list[str]]:
         categories: dict[str, list[str]] = {
             "users": [],
@@ -1,8 +1,11 @@
 import json
+from collections.abc import Iterable
 from pathlib import Path
 
 from rich.console import Console
 
+from .clients import _shared
+
 console = Console(stderr=True)
 
 
@@ -24,3 +27,13 @@ class UserResolver:
     def get_display_name(self, email: str) -> str:
         """Returns the display name if found in the local cache, else empty string."""
         return self.cache.get(email, "")
+
+    def get_display_names(self, emails: Iterable[str]) -> dict[str, str]:
+        """Resolves many users at once, returning only those with a known name."""
+        return {e: name for e in emails if (name := self.cache.get(e))}
+
+
+@_shared
+def get_user_resolver() -> UserResolver:
+    """Process-wide resolver, so users.json is read once per run, not per project."""
+    return UserResolver()
@@ -1,43 +1,50 @@
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from google.api_core import exceptions
-from tenacity import retry
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from ..clients import get_asset_client
-from ..core import RETRY_CONFIG
 from ..logger import logger
 
+ASSET_SEARCH_PAGE_SIZE = 500
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
-def search_all_instances(scope: str) -> dict[str, dict[str, Any]]:
-    """
-    Searches for all Compute Instances within the given scope (Project, Folder, or Org).
-    Returns a dict mapping instance_id -> {name, machine_type, ...}
-    """
-    client = get_asset_client()
 
-    # Ensure scope is formatted correctly
-    if (
-        not scope.startswith("projects/")
-        and not scope.startswith("folders/")
-        and not scope.startswith("organizations/")
-    ):
-        # Assume project ID if bare string
-        scope = f"projects/{scope}"
+# Upper bound on concurrent per-project asset searches
+MAX_ASSET_SEARCH_WORKERS = 64
 
-    results = {}
+# Quota errors worth backing off on before giving up on a scope.
+# ServiceUnavailable is already retried by search_all_resources' GAPIC default.
+RETRYABLE_ERRORS = (exceptions.TooManyRequests,)
 
-    try:
-        # Search for GCE Instances
-        response = client.search_all_resources(
-            request={
-                "scope": scope,
-                "asset_types": ["compute.googleapis.com/Instance"],
-                "read_mask": "name,displayName,additionalAttributes",
-            }
-        )
 
-        for resource in response:
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    retry=retry_if_exception_type(RETRYABLE_ERRORS),
+    reraise=True,
+)
+def _search_instances(scope: str) -> dict[str, dict[str, Any]]:
+    client = get_asset_client()
+    response = client.search_all_resources(
+        request={
+            "scope": scope,
+            "asset_types": ["compute.googleapis.com/Instance"],
+            "read_mask": "name,displayName,additionalAttributes",
+            # Max page size: fewer round-trips for org-wide scopes
+            "page_size": ASSET_SEARCH_PAGE_SIZE,
+        }
+    )
+
+    results = {}
+    for page in response.pages:
+        for resource in page.results:
             # resource.name is the full asset name
             # resource.display_name is the VM name
             # resource.additional_attributes is a Struct
@@ -52,7 +59,25 @@ def search_all_instances(scope: str) -> dict[str, dict[str, Any]]:
                     "zone": resource.location,
                     "project": resource.project,
                 }
+    return results
 
+
+def search_all_instances(scope: str) -> dict[str, dict[str, Any]]:
+    """
+    Searches for all Compute Instances within the given scope (Project, Folder, or Org).
+    Returns a dict mapping instance_id -> {name, machine_type, ...}
+    """
+    # Ensure scope is formatted correctly
+    if (
+        not scope.startswith("projects/")
+        and not scope.startswith("folders/")
+        and not scope.startswith("organizations/")
+    ):
+        # Assume project ID if bare string
+        scope = f"projects/{scope}"
+
+    try:
+        return _search_instances(scope)
     except exceptions.PermissionDenied:
         logger.warning(f"Permission denied searching assets in scope: {scope}")
     except exceptions.GoogleAPICallError as e:
@@ -60,4 +85,60 @@ def search_all_instances(scope: str) -> dict[str, dict[str, Any]]:
     except Exception as e:
         logger.error(f"Unexpected error searching assets in {scope}: {e}")
 
+    return {}
+
+
+def search_project_instances(
+    project_ids: Collection[str],
+) -> dict[str, dict[str, Any]]:
+    """
+    Searches each project's Compute Instances concurrently, with the pool
+    sized to the number of projects (up to MAX_ASSET_SEARCH_WORKERS).
+    Returns the merged instance_id -> {name, machine_type, ...} mapping;
+    projects whose search fails are logged and left out.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    if not project_ids:
+        return results
+
+    workers = min(len(project_ids), MAX_ASSET_SEARCH_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_search_instances, f"projects/{pid}"): pid
+            for pid in project_ids
+        }
+        for future in as_completed(futures):
+            try:
+                results.update(future.result())
+            except Exception as e:
+                logger.warning(f"Dropped asset inventory for {futures[future]}: {e}")
     return results
+
+
+def search_resource_locations(
+    scope: str, asset_types: list[str]
+) -> dict[str, set[str]] | None:
+    """
+    Returns the distinct locations holding resources of each asset type in scope,
+    or None if Cloud Asset could not be queried (caller should assume any region).
+    """
+    locations: dict[str, set[str]] = {t: set() for t in asset_types}
+
+    try:
+        client = get_asset_client()
+        response = client.search_all_resources(
+            request={
+                "scope": scope,
+                "asset_types": asset_types,
+                "read_mask": "assetType,location",
+                "page_size": ASSET_SEARCH_PAGE_SIZE,
+            }
+        )
+        for page in response.pages:
+            for resource in page.results:
+                locations.setdefault(resource.asset_type, set()).add(resource.location)
+    except Exception as e:
+        logger.debug(f"Asset location lookup failed for {scope}: {e}")
+        return None
+
+    return locations
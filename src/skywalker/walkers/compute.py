@@ -1,4 +1,6 @@
 import time
+from collections.abc import Collection
+from typing import Any
 
 from google.cloud import compute_v1, monitoring_v3
 from tenacity import retry
@@ -10,7 +12,7 @@ from ..clients import (
     get_compute_snapshots_client,
     get_monitoring_client,
 )
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS, RETRY_CONFIG
 from ..logger import logger
 from ..schemas.compute import (
     GCPComputeInstance,
@@ -21,12 +23,17 @@ from ..schemas.compute import (
     GCPSnapshot,
 )
 
+# Instance metric filters
+_CPU_FILTER = 'metric.type = "compute.googleapis.com/instance/cpu/utilization"'
+_MEM_FILTER = 'metric.type = "agent.googleapis.com/memory/percent_used"'
+_GPU_UTIL_FILTER = 'metric.type = "agent.googleapis.com/gpu/utilization"'
+_GPU_MEM_FILTER = 'metric.type = "agent.googleapis.com/gpu/memory/utilization"'
 
-def _fetch_performance_metrics(
-    project_id: str, zone: str
-) -> dict[str, dict[str, float]]:
+
+def _fetch_performance_metrics(project_id: str) -> dict[str, dict[str, float]]:
     """
-    Fetches recent CPU, Memory, and GPU metrics for all instances in a zone.
+    Fetches recent CPU, Memory, and GPU metrics for all instances in the
+    project (4 calls instead of 4/zone).
     Returns a dict mapping instance_id -> { 'cpu': float, 'mem': float, ... }
     """
     client = get_monitoring_client()
@@ -47,14 +54,10 @@ def _fetch_performance_metrics(
 
     # 1. CPU Utilization
     try:
-        cpu_filter = (
-            'metric.type = "compute.googleapis.com/instance/cpu/utilization" '
-            f'AND resource.labels.zone = "{zone}"'
-        )
         cpu_results = client.list_time_series(
             request={
                 "name": project_name,
-                "filter": cpu_filter,
+                "filter": _CPU_FILTER,
                 "interval": interval,
                 "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
             }
@@ -65,19 +68,17 @@ def _fetch_performance_metrics(
                 metrics_map.setdefault(instance_id, {})["cpu"] = (
                     ts.points[0].value.double_value * 100
                 )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.debug(f"Failed to fetch CPU metrics for {zone}: {e}")
+        logger.debug(f"Failed to fetch CPU metrics for {project_id}: {e}")
 
     # 2. Memory Usage (requires Ops Agent)
     try:
-        mem_filter = (
-            'metric.type = "agent.googleapis.com/memory/percent_used" '
-            f'AND resource.labels.zone = "{zone}"'
-        )
         mem_results = client.list_time_series(
             request={
                 "name": project_name,
-                "filter": mem_filter,
+                "filter": _MEM_FILTER,
                 "interval": interval,
                 "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
             }
@@ -88,19 +89,17 @@ def _fetch_performance_metrics(
                 metrics_map.setdefault(instance_id, {})["mem"] = ts.points[
                     0
                 ].value.double_value
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.debug(f"Failed to fetch Memory metrics for {zone}: {e}")
+        logger.debug(f"Failed to fetch Memory metrics for {project_id}: {e}")
 
     # 3. GPU Utilization (Ops Agent)
     try:
-        gpu_util_filter = (
-            'metric.type = "agent.googleapis.com/gpu/utilization" '
-            f'AND resource.labels.zone = "{zone}"'
-        )
         gpu_util_results = client.list_time_series(
             request={
                 "name": project_name,
-                "filter": gpu_util_filter,
+                "filter": _GPU_UTIL_FILTER,
                 "interval": interval,
                 "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
             }
@@ -112,19 +111,17 @@ def _fetch_performance_metrics(
                 inst_data = metrics_map.setdefault(instance_id, {})
                 current_max = inst_data.get("gpu_util", 0.0)
                 inst_data["gpu_util"] = max(current_max, val)
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.debug(f"Failed to fetch GPU utilization for {zone}: {e}")
+        logger.debug(f"Failed to fetch GPU utilization for {project_id}: {e}")
 
     # 4. GPU Memory (Ops Agent)
     try:
-        gpu_mem_util_filter = (
-            'metric.type = "agent.googleapis.com/gpu/memory/utilization" '
-            f'AND resource.labels.zone = "{zone}"'
-        )
         gpu_mem_results = client.list_time_series(
             request={
                 "name": project_name,
-                "filter": gpu_mem_util_filter,
+                "filter": _GPU_MEM_FILTER,
                 "interval": interval,
                 "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
             }
@@ -136,101 +133,111 @@ def _fetch_performance_metrics(
                 inst_data = metrics_map.setdefault(instance_id, {})
                 current_max = inst_data.get("gpu_mem", 0.0)
                 inst_data["gpu_mem"] = max(current_max, val)
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.debug(f"Failed to fetch GPU Memory metrics for {zone}: {e}")
+        logger.debug(f"Failed to fetch GPU Memory metrics for {project_id}: {e}")
 
     return metrics_map
 
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
-def _list_instances_inventory(project_id: str, zone: str) -> list[GCPComputeInstance]:
-    """
-    Fetches raw inventory of instances. Cached.
-    """
-    instance_client = get_compute_instances_client()
-    request = compute_v1.ListInstancesRequest(project=project_id, zone=zone)
+def _to_instance(instance: Any, zone: str) -> GCPComputeInstance:
+    """Converts a compute_v1 Instance into our schema."""
+    # 1. Clean Machine Type
+    m_type = instance.machine_type
+    machine_type_clean = m_type.split("/")[-1] if m_type else "unknown"
 
-    results = []
+    # 2. Extract GPUs
+    gpus = []
+    if instance.guest_accelerators:
+        for acc in instance.guest_accelerators:
+            acc_type = acc.accelerator_type.split("/")[-1]
+            gpus.append(
+                GCPGpu(name=acc_type, count=acc.accelerator_count, type=acc_type)
+            )
 
-    for instance in instance_client.list(request=request):
-        # 1. Clean Machine Type
-        m_type = instance.machine_type
-        machine_type_clean = m_type.split("/")[-1] if m_type else "unknown"
-
-        # 2. Extract GPUs
-        gpus = []
-        if instance.guest_accelerators:
-            for acc in instance.guest_accelerators:
-                acc_type = acc.accelerator_type.split("/")[-1]
-                gpus.append(
-                    GCPGpu(name=acc_type, count=acc.accelerator_count, type=acc_type)
+    # 3. Extract Disks
+    disks = []
+    if instance.disks:
+        for d in instance.disks:
+            disks.append(
+                GCPDisk(
+                    name=d.device_name or "unknown",
+                    size_gb=d.disk_size_gb,
+                    type=str(d.type_),
+                    boot=d.boot,
                 )
+            )
 
-        # 3. Extract Disks
-        disks = []
-        if instance.disks:
-            for d in instance.disks:
-                disks.append(
-                    GCPDisk(
-                        name=d.device_name or "unknown",
-                        size_gb=d.disk_size_gb,
-                        type=str(d.type_),
-                        boot=d.boot,
-                    )
-                )
+    # 4. Extract IPs
+    internal_ip = None
+    external_ip = None
+    if instance.network_interfaces:
+        nic = instance.network_interfaces[0]
+        internal_ip = nic.network_i_p
+        if nic.access_configs:
+            external_ip = nic.access_configs[0].nat_i_p
+
+    return GCPComputeInstance(
+        name=instance.name,
+        id=str(instance.id),
+        status=instance.status,
+        machine_type=machine_type_clean,
+        zone=zone,
+        creation_timestamp=instance.creation_timestamp,
+        labels=dict(instance.labels) if instance.labels else {},
+        disks=disks,
+        gpus=gpus,
+        internal_ip=internal_ip,
+        external_ip=external_ip,
+    )
 
-        # 4. Extract IPs
-        internal_ip = None
-        external_ip = None
-        if instance.network_interfaces:
-            nic = instance.network_interfaces[0]
-            internal_ip = nic.network_i_p
-            if nic.access_configs:
-                external_ip = nic.access_configs[0].nat_i_p
 
-        results.append(
-            GCPComputeInstance(
-                name=instance.name,
-                id=str(instance.id),
-                status=instance.status,
-                machine_type=machine_type_clean,
-                zone=zone,
-                creation_timestamp=instance.creation_timestamp,
-                labels=dict(instance.labels) if instance.labels else {},
-                disks=disks,
-                gpus=gpus,
-                internal_ip=internal_ip,
-                external_ip=external_ip,
-            )
-        )
+@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
+def list_instances_aggregated(
+    project_id: str, zones: Collection[str]
+) -> list[GCPComputeInstance]:
+    """
+    Lists instances across all zones with one aggregatedList call (instead of
+    one list call per zone), keeping only the requested zones.
+    """
+    instance_client = get_compute_instances_client()
+    request = compute_v1.AggregatedListInstancesRequest(
+        project=project_id, max_results=500
+    )
 
+    wanted = frozenset(zones)
+    results: list[GCPComputeInstance] = []
+    for scope, scoped_list in instance_client.aggregated_list(request=request):
+        # Every zone is listed; most scopes only carry an "empty" warning
+        if not scoped_list.instances:
+            continue
+        # scope is "zones/<zone>"
+        zone = scope.rpartition("/")[2]
+        if zone in wanted:
+            results.extend(_to_instance(i, zone) for i in scoped_list.instances)
     return results
 
 
-def list_instances(
-    project_id: str, zone: str, include_metrics: bool = False
-) -> list[GCPComputeInstance]:
+def fetch_instance_metrics(project_id: str) -> dict[str, dict[str, float]]:
     """
-    Public API: Lists instances, optionally enriched with live metrics.
-    Inventory is cached; Metrics are NOT cached.
+    Fetches live metrics for every instance in the project in one pass,
+    so multi-zone audits don't repeat the same queries per zone.
     """
-    # 1. Get Inventory (Cached)
-    instances = _list_instances_inventory(project_id, zone)
-
-    # 2. Get Metrics (Live) and Merge
-    if include_metrics:
-        metrics = _fetch_performance_metrics(project_id, zone)
-        for inst in instances:
-            if inst.id in metrics:
-                m = metrics[inst.id]
-                inst.cpu_utilization = m.get("cpu")
-                inst.memory_usage = m.get("mem")
-                inst.gpu_utilization = m.get("gpu_util")
-                inst.gpu_memory_usage = m.get("gpu_mem")
-
-    from typing import cast
-
-    return cast(list[GCPComputeInstance], instances)
+    return _fetch_performance_metrics(project_id)
+
+
+def apply_instance_metrics(
+    instances: list[GCPComputeInstance], metrics: dict[str, dict[str, float]]
+) -> None:
+    """Merges a metrics map (from fetch_instance_metrics) onto instances."""
+    for inst in instances:
+        if inst.id in metrics:
+            m = metrics[inst.id]
+            inst.cpu_utilization = m.get("cpu")
+            inst.memory_usage = m.get("mem")
+            inst.gpu_utilization = m.get("gpu_util")
+            inst.gpu_memory_usage = m.get("gpu_mem")
 
 
 @retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
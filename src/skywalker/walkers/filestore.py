@@ -1,60 +1,72 @@
+from collections.abc import Collection
+from typing import Any
+
 from google.cloud import filestore_v1
-from tenacity import retry
 
 from ..clients import get_filestore_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS
 from ..schemas.filestore import GCPFilestoreInstance
 
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
-def list_instances(project_id: str, location: str) -> list[GCPFilestoreInstance]:
+def _to_instance(instance: Any, location: str) -> GCPFilestoreInstance:
+    """Converts a Filestore API instance into our schema."""
+    # Extract IPs
+    ips = [n.ip_addresses[0] for n in instance.networks if n.ip_addresses]
+
+    # Clean tier and state names
+    if hasattr(instance.tier, "name"):
+        tier_str = instance.tier.name
+    else:
+        try:
+            tier_str = filestore_v1.Instance.Tier(instance.tier).name
+        except Exception:
+            tier_str = str(instance.tier)
+
+    if hasattr(instance.state, "name"):
+        state_str = instance.state.name
+    else:
+        try:
+            state_str = filestore_v1.Instance.State(instance.state).name
+        except Exception:
+            state_str = str(instance.state)
+
+    capacity = 0
+    if instance.file_shares:
+        capacity = instance.file_shares[0].capacity_gb
+
+    return GCPFilestoreInstance(
+        name=instance.name.split("/")[-1],
+        tier=tier_str,
+        state=state_str,
+        capacity_gb=capacity,
+        ip_addresses=ips,
+        create_time=instance.create_time,
+        location=location,
+    )
+
+
+def list_instances_all_locations(
+    project_id: str, locations: Collection[str]
+) -> list[GCPFilestoreInstance]:
     """
-    Lists all Filestore instances in a specific location (region or zone).
+    Lists Filestore instances in every location of a project with one call
+    (the `locations/-` wildcard), keeping those in the given zones/regions.
     """
     client = get_filestore_client()
-    parent = f"projects/{project_id}/locations/{location}"
+    parent = f"projects/{project_id}/locations/-"
+    wanted = frozenset(locations)
 
     results = []
     try:
-        # Check: The parent must be a location.
         for instance in client.list_instances(parent=parent):
-            # Extract IPs
-            ips = [n.ip_addresses[0] for n in instance.networks if n.ip_addresses]
-
-            # Clean tier and state names
-            if hasattr(instance.tier, "name"):
-                tier_str = instance.tier.name
-            else:
-                try:
-                    tier_str = filestore_v1.Instance.Tier(instance.tier).name
-                except Exception:
-                    tier_str = str(instance.tier)
-
-            if hasattr(instance.state, "name"):
-                state_str = instance.state.name
-            else:
-                try:
-                    state_str = filestore_v1.Instance.State(instance.state).name
-                except Exception:
-                    state_str = str(instance.state)
-
-            capacity = 0
-            if instance.file_shares:
-                capacity = instance.file_shares[0].capacity_gb
-
-            results.append(
-                GCPFilestoreInstance(
-                    name=instance.name.split("/")[-1],
-                    tier=tier_str,
-                    state=state_str,
-                    capacity_gb=capacity,
-                    ip_addresses=ips,
-                    create_time=instance.create_time,
-                    location=location,
-                )
-            )
+            # projects/{project}/locations/{location}/instances/{name}
+            location = instance.name.split("/")[3]
+            if location in wanted:
+                results.append(_to_instance(instance, location))
+    except FATAL_ERRORS:
+        raise
     except Exception:
-        # If the region has no instances or API is disabled, just return empty
+        # If the API is disabled, just return empty
         pass
 
     return results
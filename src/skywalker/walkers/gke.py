@@ -1,19 +1,50 @@
+from collections.abc import Collection
+from typing import Any
+
 from google.cloud import container_v1
-from tenacity import retry
 
 from ..clients import get_gke_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS
 from ..logger import logger
 from ..schemas.gke import GCPCluster, GCPNodePool
 
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
-def list_clusters(project_id: str, location: str) -> list[GCPCluster]:
+def _to_cluster(cluster: Any) -> GCPCluster:
+    node_pools = []
+    for np in cluster.node_pools:
+        node_pools.append(
+            GCPNodePool(
+                name=np.name,
+                machine_type=np.config.machine_type,
+                disk_size_gb=np.config.disk_size_gb,
+                node_count=np.initial_node_count,
+                version=np.version,
+                status=str(np.status.name),
+            )
+        )
+
+    return GCPCluster(
+        name=cluster.name,
+        location=cluster.location,
+        status=str(cluster.status.name),
+        version=cluster.current_master_version,
+        endpoint=cluster.endpoint,
+        node_pools=node_pools,
+        network=cluster.network,
+        subnetwork=cluster.subnetwork,
+    )
+
+
+def list_clusters_all_locations(
+    project_id: str, locations: Collection[str]
+) -> list[GCPCluster]:
     """
-    Lists all GKE clusters in a specific location (region or zone).
+    Lists GKE clusters in every location of a project with one call
+    (the `locations/-` wildcard), keeping those in the given zones/regions.
     """
     client = get_gke_client()
-    parent = f"projects/{project_id}/locations/{location}"
+    parent = f"projects/{project_id}/locations/-"
+    wanted = frozenset(locations)
 
     results = []
     try:
@@ -21,32 +52,17 @@ def list_clusters(project_id: str, location: str) -> list[GCPCluster]:
         response = client.list_clusters(request=request)
 
         for cluster in response.clusters:
-            node_pools = []
-            for np in cluster.node_pools:
-                node_pools.append(
-                    GCPNodePool(
-                        name=np.name,
-                        machine_type=np.config.machine_type,
-                        disk_size_gb=np.config.disk_size_gb,
-                        node_count=np.initial_node_count,
-                        version=np.version,
-                        status=str(np.status.name),
-                    )
-                )
-
-            results.append(
-                GCPCluster(
-                    name=cluster.name,
-                    location=cluster.location,
-                    status=str(cluster.status.name),
-                    version=cluster.current_master_version,
-                    endpoint=cluster.endpoint,
-                    node_pools=node_pools,
-                    network=cluster.network,
-                    subnetwork=cluster.subnetwork,
-                )
+            if cluster.location in wanted:
+                results.append(_to_cluster(cluster))
+        # Locations that could not be reached are reported, not raised
+        if response.missing_zones:
+            logger.warning(
+                f"GKE listing for {project_id} skipped unreachable zones: "
+                f"{', '.join(response.missing_zones)}"
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
-        logger.warning(f"Failed to list clusters in {location} for {project_id}: {e}")
+        logger.warning(f"Failed to list clusters for {project_id}: {e}")
 
     return results
@@ -3,7 +3,7 @@ from google.iam.v1 import iam_policy_pb2
 from tenacity import retry
 
 from ..clients import get_iam_client, get_projects_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS, RETRY_CONFIG
 from ..logger import logger
 from ..schemas.iam import GCPIAMReport, GCPKey, GCPPolicyBinding, GCPServiceAccount
 
@@ -40,6 +40,8 @@ def get_iam_report(project_id: str) -> GCPIAMReport:
                             valid_before=k.valid_before_time,
                         )
                     )
+            except FATAL_ERRORS:
+                raise
             except Exception as e:
                 logger.debug(f"Failed to list keys for SA {sa.email}: {e}")
 
@@ -53,6 +55,8 @@ def get_iam_report(project_id: str) -> GCPIAMReport:
                     keys=keys,
                 )
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list Service Accounts for {project_id}: {e}")
 
@@ -66,6 +70,8 @@ def get_iam_report(project_id: str) -> GCPIAMReport:
             report.policy_bindings.append(
                 GCPPolicyBinding(role=binding.role, members=list(binding.members))
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to fetch IAM policy for {project_id}: {e}")
 
@@ -4,14 +4,33 @@ from typing import Any
 
 from google.api_core import exceptions
 from google.cloud import monitoring_v3
-from tenacity import retry
 
 from ..clients import get_monitoring_client
-from ..core import RETRY_CONFIG
 from ..logger import logger
 
+# Metrics map: metric_label -> filter_string
+# Built once at import; the same filters are sent for every scoping project.
+# Note: We fetch ALL instances in the scope.
+FLEET_METRIC_FILTERS = {
+    "cpu_percent": (
+        'metric.type = "compute.googleapis.com/instance/cpu/utilization" '
+        'AND resource.type = "gce_instance"'
+    ),
+    "memory_percent": (
+        'metric.type = "agent.googleapis.com/memory/percent_used" '
+        'AND resource.type = "gce_instance"'
+    ),
+    "gpu_utilization": (
+        'metric.type = "agent.googleapis.com/gpu/utilization" '
+        'AND resource.type = "gce_instance"'
+    ),
+    "gpu_memory_utilization": (
+        'metric.type = "agent.googleapis.com/gpu/memory/utilization" '
+        'AND resource.type = "gce_instance"'
+    ),
+}
+
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
 def fetch_fleet_metrics(scoping_project_id: str) -> list[dict[str, Any]]:
     """
     Fetches aggregated metrics for ALL projects monitored by the scoping project.
@@ -30,33 +49,12 @@ def fetch_fleet_metrics(scoping_project_id: str) -> list[dict[str, Any]]:
         }
     )
 
-    # Metrics map: metric_label -> filter_string
-    # Note: We fetch ALL instances in the scope.
-    queries = {
-        "cpu_percent": (
-            'metric.type = "compute.googleapis.com/instance/cpu/utilization" '
-            'AND resource.type = "gce_instance"'
-        ),
-        "memory_percent": (
-            'metric.type = "agent.googleapis.com/memory/percent_used" '
-            'AND resource.type = "gce_instance"'
-        ),
-        "gpu_utilization": (
-            'metric.type = "agent.googleapis.com/gpu/utilization" '
-            'AND resource.type = "gce_instance"'
-        ),
-        "gpu_memory_utilization": (
-            'metric.type = "agent.googleapis.com/gpu/memory/utilization" '
-            'AND resource.type = "gce_instance"'
-        ),
-    }
-
     # Intermediate storage: instance_unique_id -> {data}
     # We use (project_id, instance_id) as the unique key to avoid collisions
     # if IDs repeat (rare but possible).
     fleet_data: dict[tuple[str, str], dict[str, Any]] = defaultdict(dict)
 
-    for label, filter_str in queries.items():
+    for label, filter_str in FLEET_METRIC_FILTERS.items():
         try:
             pages = client.list_time_series(
                 request={
@@ -111,22 +109,14 @@ def fetch_fleet_metrics(scoping_project_id: str) -> list[dict[str, Any]]:
     return list(fleet_data.values())
 
 
-def fetch_inactive_resources(
-    project_id: str,
+def _window_sum_request(
+    name: str,
     metric_type: str,
     resource_type: str,
-    days: int = 30,
-    group_by: list[str] | None = None,
-) -> dict[str, float]:
-    """
-    Fetches the SUM of a metric over a long period to detect inactivity.
-    Returns: {resource_name: total_value}
-
-    If total_value == 0, the resource is inactive (Zombie).
-    """
-    client = get_monitoring_client()
-    name = f"projects/{project_id}"
-
+    days: int,
+    group_by: list[str] | None,
+) -> dict[str, Any]:
+    """Builds a list_time_series request summing a metric over `days`."""
     now = time.time()
     seconds = int(now)
     start_seconds = seconds - (days * 86400)
@@ -144,14 +134,6 @@ def fetch_inactive_resources(
     # Note: 30 days is a huge window. We must use a large alignment period.
     alignment_period = {"seconds": days * 86400}
 
-    if not group_by:
-        # Default grouping depends on resource type usually, but we need
-        # the resource identifier labels.
-        # For buckets: resource.label.bucket_name
-        # For SQL: resource.label.database_id
-        # For Filestore: resource.label.instance_id
-        pass
-
     aggregation = monitoring_v3.Aggregation(
         {
             "alignment_period": alignment_period,
@@ -161,47 +143,108 @@ def fetch_inactive_resources(
         }
     )
 
+    return {
+        "name": name,
+        "filter": filter_str,
+        "interval": interval,
+        "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+        "aggregation": aggregation,
+    }
+
+
+def _label_value(ts: Any, field: str) -> str | None:
+    """Finds a grouped label (e.g. resource.label.bucket_name) on a series."""
+    # The Aggregation API puts grouped labels in metric/resource labels.
+    label_key = field.split(".")[-1]
+    value = ts.resource.labels.get(label_key) or ts.metric.labels.get(label_key)
+    return str(value) if value else None
+
+
+def _point_sum(ts: Any) -> float:
+    point = ts.points[0].value
+    return float(point.double_value or point.int64_value)
+
+
+def fetch_inactive_resources(
+    project_id: str,
+    metric_type: str,
+    resource_type: str,
+    days: int = 30,
+    group_by: list[str] | None = None,
+) -> dict[str, float]:
+    """
+    Fetches the SUM of a metric over a long period to detect inactivity.
+    Returns: {resource_name: total_value}
+
+    If total_value == 0, the resource is inactive (Zombie).
+    """
+    client = get_monitoring_client()
+
+    # Default grouping depends on resource type usually, but we need
+    # the resource identifier labels.
+    # For buckets: resource.label.bucket_name
+    # For SQL: resource.label.database_id
+    # For Filestore: resource.label.instance_id
+    request = _window_sum_request(
+        f"projects/{project_id}", metric_type, resource_type, days, group_by
+    )
+
     results = {}
     try:
-        pages = client.list_time_series(
-            request={
-                "name": name,
-                "filter": filter_str,
-                "interval": interval,
-                "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-                "aggregation": aggregation,
-            }
-        )
-        for ts in pages:
-            # Identifier logic depends on what we grouped by
-            # Usually the first label in the group_by list is the key
+        for ts in client.list_time_series(request=request):
             if not ts.points:
                 continue
 
-            val = ts.points[0].value.double_value or float(
-                ts.points[0].value.int64_value
-            )
-
-            # Key construction
-            # If we grouped by ["resource.label.bucket_name"],
-            # we check ts.resource.labels["bucket_name"]
-            # But the Aggregation API puts grouped labels in metric/resource labels.
-
-            # Helper to find the key
+            # Usually the first label in the group_by list is the key
             key = "unknown"
             if group_by:
-                # Try to find the value of the first grouping field in labels
-                field = group_by[0]
-                label_key = field.split(".")[-1]
-                key = (
-                    ts.resource.labels.get(label_key)
-                    or ts.metric.labels.get(label_key)
-                    or "unknown"
-                )
+                key = _label_value(ts, group_by[0]) or "unknown"
 
-            results[key] = val
+            results[key] = _point_sum(ts)
 
     except Exception as e:
         logger.debug(f"Failed to fetch inactivity metric {metric_type}: {e}")
 
     return results
+
+
+def fetch_inactive_resources_by_project(
+    scoping_project_id: str,
+    metric_type: str,
+    resource_type: str,
+    label: str,
+    days: int = 30,
+) -> dict[str, dict[str, float]]:
+    """
+    Like fetch_inactive_resources, but for every project monitored by the
+    scoping project in one query.
+    Returns: {project_id: {resource_name: total_value}}
+
+    Projects outside the metrics scope, or without a single series for the
+    metric, are absent from the result (not reported as all-zero).
+    """
+    client = get_monitoring_client()
+    request = _window_sum_request(
+        f"projects/{scoping_project_id}",
+        metric_type,
+        resource_type,
+        days,
+        ["resource.label.project_id", f"resource.label.{label}"],
+    )
+
+    results: dict[str, dict[str, float]] = defaultdict(dict)
+    try:
+        for ts in client.list_time_series(request=request):
+            project_id = _label_value(ts, "project_id")
+            name = _label_value(ts, label)
+            if not ts.points or not project_id or not name:
+                continue
+            results[project_id][name] = _point_sum(ts)
+
+    except Exception as e:
+        logger.debug(
+            f"Failed to fetch inactivity metric {metric_type} "
+            f"from scope {scoping_project_id}: {e}"
+        )
+
+    return dict(results)
@@ -6,7 +6,7 @@ from ..clients import (
     get_networks_client,
     get_subnetworks_client,
 )
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS, RETRY_CONFIG
 from ..logger import logger
 from ..schemas.network import (
     GCPVPC,
@@ -53,6 +53,8 @@ def get_network_report(project_id: str) -> GCPNetworkReport:
                     target_tags=list(fw.target_tags) if fw.target_tags else [],
                 )
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list firewalls for {project_id}: {e}")
 
@@ -62,21 +64,25 @@ def get_network_report(project_id: str) -> GCPNetworkReport:
         for net in net_client.list(project=project_id):
             vpc = GCPVPC(name=net.name)
             report.vpcs.append(vpc)
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list networks for {project_id}: {e}")
 
-    # 3. Subnets (Aggregated List)
+    # 3. Subnets (Aggregated List) - they are only reported under their VPC,
+    # so a project without VPCs skips the call
     try:
+        vpcs_by_name = {v.name: v for v in report.vpcs}
         subnet_client = get_subnetworks_client()
-        for region, subnet_list in subnet_client.aggregated_list(project=project_id):
+        subnet_pages = (
+            subnet_client.aggregated_list(project=project_id) if vpcs_by_name else ()
+        )
+        for region, subnet_list in subnet_pages:
             if not subnet_list.subnetworks:
                 continue
 
             for sn in subnet_list.subnetworks:
-                network_name = sn.network.split("/")[-1]
-                found_vpc = next(
-                    (v for v in report.vpcs if v.name == network_name), None
-                )
+                found_vpc = vpcs_by_name.get(sn.network.split("/")[-1])
                 if found_vpc:
                     found_vpc.subnets.append(
                         GCPSubnet(
@@ -87,10 +93,23 @@ def get_network_report(project_id: str) -> GCPNetworkReport:
                             flow_logs=bool(sn.enable_flow_logs),
                         )
                     )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list subnets for {project_id}: {e}")
 
     # 4. Addresses (Static IPs) - Aggregated List
+    report.addresses = list_addresses(project_id)
+
+    return report
+
+
+def list_addresses(project_id: str) -> list[GCPAddress]:
+    """
+    Lists the project's reserved IP addresses across all regions with one
+    aggregatedList call.
+    """
+    results = []
     try:
         addr_client = get_addresses_client()
         for region, addr_list in addr_client.aggregated_list(project=project_id):
@@ -98,7 +117,7 @@ def get_network_report(project_id: str) -> GCPNetworkReport:
                 continue
 
             for addr in addr_list.addresses:
-                report.addresses.append(
+                results.append(
                     GCPAddress(
                         name=addr.name,
                         address=addr.address,
@@ -108,7 +127,9 @@ def get_network_report(project_id: str) -> GCPNetworkReport:
                         address_type=str(addr.address_type),
                     )
                 )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list static IPs for {project_id}: {e}")
 
-    return report
+    return results
@@ -1,13 +1,11 @@
 from google.cloud import run_v2
-from tenacity import retry
 
 from ..clients import get_run_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS
 from ..logger import logger
 from ..schemas.run import GCPCloudRunService
 
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
 def list_services(project_id: str, region: str) -> list[GCPCloudRunService]:
     """
     Lists Cloud Run services in a specific region.
@@ -37,6 +35,8 @@ def list_services(project_id: str, region: str) -> list[GCPCloudRunService]:
                     generation=service.generation,
                 )
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(
             f"Failed to list Cloud Run services in {region} for {project_id}: {e}"
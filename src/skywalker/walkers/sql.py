@@ -1,7 +1,7 @@
 from tenacity import retry
 
 from ..clients import get_sql_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS, RETRY_CONFIG
 from ..logger import logger
 from ..schemas.sql import GCPSQLInstance
 
@@ -44,6 +44,8 @@ def list_instances(project_id: str) -> list[GCPSQLInstance]:
                     storage_limit_gb=int(settings.get("dataDiskSizeGb", 0)),
                 )
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list SQL instances for {project_id}: {e}")
 
@@ -4,7 +4,7 @@ from google.cloud import monitoring_v3
 from tenacity import retry
 
 from ..clients import get_monitoring_client, get_storage_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS, RETRY_CONFIG
 from ..logger import logger
 from ..schemas.storage import GCPBucket
 
@@ -61,6 +61,8 @@ def fetch_bucket_sizes(project_id: str) -> dict[str, int]:
             bucket_name = series.resource.labels["bucket_name"]
             if series.points:
                 sizes[bucket_name] = int(series.points[0].value.double_value)
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.debug(f"Failed to fetch bucket sizes for {project_id}: {e}")
 
@@ -77,10 +79,10 @@ def list_buckets(project_id: str) -> list[GCPBucket]:
         storage_client = get_storage_client()
         # Note: we don't pass project to storage.Client() anymore as it's shared,
         # but we use list_buckets(project=project_id)
-        buckets = storage_client.list_buckets(project=project_id)
+        buckets = list(storage_client.list_buckets(project=project_id))
 
-        # Fetch sizes in bulk
-        bucket_sizes = fetch_bucket_sizes(project_id)
+        # Fetch sizes in bulk (skipping the Monitoring query for empty projects)
+        bucket_sizes = fetch_bucket_sizes(project_id) if buckets else {}
 
         for bucket in buckets:
             size = bucket_sizes.get(bucket.name, 0)
@@ -101,6 +103,8 @@ def list_buckets(project_id: str) -> list[GCPBucket]:
                     size_bytes=size,
                 )
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.warning(f"Failed to list buckets for {project_id}: {e}")
 
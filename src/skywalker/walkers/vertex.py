@@ -1,25 +1,20 @@
 from google.cloud import aiplatform
-from tenacity import retry
 
 from ..clients import get_notebook_client
-from ..core import RETRY_CONFIG
+from ..core import FATAL_ERRORS
 from ..logger import logger
 from ..schemas.vertex import (
     GCPVertexEndpoint,
     GCPVertexModel,
     GCPVertexNotebook,
-    GCPVertexReport,
 )
 
 
-@retry(**RETRY_CONFIG)  # type: ignore[call-overload, untyped-decorator]
-def get_vertex_report(project_id: str, location: str) -> GCPVertexReport:
+def list_notebooks(project_id: str, location: str) -> list[GCPVertexNotebook]:
     """
-    Scans Vertex AI resources in a specific region.
+    Lists Vertex AI Workbench (Notebooks) instances in a specific region.
     """
-    report = GCPVertexReport()
-
-    # 1. Notebooks (Workbench Instances)
+    notebooks: list[GCPVertexNotebook] = []
     nb_client = get_notebook_client()
     parent = f"projects/{project_id}/locations/{location}"
 
@@ -28,7 +23,7 @@ def get_vertex_report(project_id: str, location: str) -> GCPVertexReport:
 
         request = notebooks_v1.ListInstancesRequest(parent=parent)
         for nb in nb_client.list_instances(request=request):
-            report.notebooks.append(
+            notebooks.append(
                 GCPVertexNotebook(
                     name=nb.name.split("/")[-1],
                     display_name=nb.name.split("/")[-1],
@@ -38,18 +33,26 @@ def get_vertex_report(project_id: str, location: str) -> GCPVertexReport:
                     location=location,
                 )
             )
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.debug(
             f"Failed to list Vertex Notebooks in {location} for {project_id}: {e}"
         )
 
-    # Initialize Vertex AI SDK for this location (Models/Endpoints)
-    try:
-        aiplatform.init(project=project_id, location=location)
+    return notebooks
 
-        # 2. Models
-        for model in aiplatform.Model.list():
-            report.models.append(
+
+def list_models(project_id: str, location: str) -> list[GCPVertexModel]:
+    """
+    Lists Vertex AI Models in a specific region.
+    Project and location are passed per call rather than through
+    `aiplatform.init`, whose global config is not safe to share across threads.
+    """
+    models: list[GCPVertexModel] = []
+    try:
+        for model in aiplatform.Model.list(project=project_id, location=location):
+            models.append(
                 GCPVertexModel(
                     name=model.resource_name.split("/")[-1],
                     display_name=model.display_name,
@@ -58,11 +61,25 @@ def get_vertex_report(project_id: str, location: str) -> GCPVertexReport:
                     location=location,
                 )
             )
+    except FATAL_ERRORS:
+        raise
+    except Exception as e:
+        logger.debug(
+            f"Vertex AI API not enabled or failed in {location} for {project_id}: {e}"
+        )
+
+    return models
+
 
-        # 3. Endpoints
-        for ep in aiplatform.Endpoint.list():
+def list_endpoints(project_id: str, location: str) -> list[GCPVertexEndpoint]:
+    """
+    Lists Vertex AI Endpoints in a specific region.
+    """
+    endpoints: list[GCPVertexEndpoint] = []
+    try:
+        for ep in aiplatform.Endpoint.list(project=project_id, location=location):
             deployed_count = len(ep.traffic_split) if ep.traffic_split else 0
-            report.endpoints.append(
+            endpoints.append(
                 GCPVertexEndpoint(
                     name=ep.resource_name.split("/")[-1],
                     display_name=ep.display_name,
@@ -70,10 +87,11 @@ def get_vertex_report(project_id: str, location: str) -> GCPVertexReport:
                     location=location,
                 )
             )
-
+    except FATAL_ERRORS:
+        raise
     except Exception as e:
         logger.debug(
             f"Vertex AI API not enabled or failed in {location} for {project_id}: {e}"
         )
 
-    return report
+    return endpoints
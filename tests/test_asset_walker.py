@@ -1,4 +1,10 @@
-from skywalker.walkers.asset import search_all_instances
+from google.api_core import exceptions
+
+from skywalker.walkers.asset import (
+    search_all_instances,
+    search_project_instances,
+    search_resource_locations,
+)
 
 
 def test_search_all_instances(mocker):
@@ -12,7 +18,9 @@ def test_search_all_instances(mocker):
     mock_res.project = "projects/test-proj"
     mock_res.additional_attributes = {"id": "123", "machineType": "n1-standard-1"}
 
-    mock_client.search_all_resources.return_value = [mock_res]
+    mock_page = mocker.Mock()
+    mock_page.results = [mock_res]
+    mock_client.search_all_resources.return_value.pages = [mock_page]
 
     results = search_all_instances("test-proj")
 
@@ -26,5 +34,103 @@ def test_search_all_instances(mocker):
             "scope": "projects/test-proj",
             "asset_types": ["compute.googleapis.com/Instance"],
             "read_mask": "name,displayName,additionalAttributes",
+            "page_size": 500,
         }
     )
+
+
+def test_search_resource_locations(mocker):
+    mock_get = mocker.patch("skywalker.walkers.asset.get_asset_client")
+    mock_client = mock_get.return_value
+
+    mock_page = mocker.Mock()
+    mock_page.results = [
+        mocker.Mock(asset_type="run.googleapis.com/Service", location="us-east1"),
+        mocker.Mock(asset_type="run.googleapis.com/Service", location="us-east1"),
+    ]
+    mock_client.search_all_resources.return_value.pages = [mock_page]
+
+    results = search_resource_locations(
+        "projects/test-proj",
+        ["run.googleapis.com/Service", "container.googleapis.com/Cluster"],
+    )
+
+    assert results == {
+        "run.googleapis.com/Service": {"us-east1"},
+        "container.googleapis.com/Cluster": set(),
+    }
+
+
+def test_search_resource_locations_failure(mocker):
+    mock_get = mocker.patch("skywalker.walkers.asset.get_asset_client")
+    mock_get.return_value.search_all_resources.side_effect = Exception("disabled")
+
+    assert search_resource_locations("projects/p", ["x"]) is None
+
+
+def test_search_all_instances_retries_quota_errors(mocker):
+    mock_get = mocker.patch("skywalker.walkers.asset.get_asset_client")
+    mock_client = mock_get.return_value
+
+    mock_res = mocker.Mock()
+    mock_res.display_name = "test-vm"
+    mock_res.location = "us-central1-a"
+    mock_res.project = "projects/test-proj"
+    mock_res.additional_attributes = {"id": "123", "machineType": "n1-standard-1"}
+    mock_page = mocker.Mock()
+    mock_page.results = [mock_res]
+    ok = mocker.Mock()
+    ok.pages = [mock_page]
+
+    mock_client.search_all_resources.side_effect = [
+        exceptions.TooManyRequests("quota"),
+        ok,
+    ]
+
+    results = search_all_instances("test-proj")
+
+    assert results["123"]["name"] == "test-vm"
+    assert mock_client.search_all_resources.call_count == 2
+
+
+def test_search_all_instances_leaves_unavailable_to_gapic_retry(mocker):
+    mock_get = mocker.patch("skywalker.walkers.asset.get_asset_client")
+    mock_client = mock_get.return_value
+    mock_client.search_all_resources.side_effect = exceptions.ServiceUnavailable("down")
+
+    assert search_all_instances("test-proj") == {}
+    mock_client.search_all_resources.assert_called_once()
+
+
+def test_search_project_instances_merges_projects(mocker):
+    mock_get = mocker.patch("skywalker.walkers.asset.get_asset_client")
+    mock_client = mock_get.return_value
+
+    def search(request):
+        project = request["scope"].split("/")[-1]
+        res = mocker.Mock(display_name=f"vm-{project}", location="us-west1-b")
+        res.project = request["scope"]
+        res.additional_attributes = {"id": project, "machineType": "e2-small"}
+        return mocker.Mock(pages=[mocker.Mock(results=[res])])
+
+    mock_client.search_all_resources.side_effect = search
+
+    results = search_project_instances(["p1", "p2"])
+
+    assert {k: v["name"] for k, v in results.items()} == {
+        "p1": "vm-p1",
+        "p2": "vm-p2",
+    }
+    assert search_project_instances([]) == {}
+
+
+def test_search_project_instances_logs_failed_projects(mocker):
+    mock_get = mocker.patch("skywalker.walkers.asset.get_asset_client")
+    mock_get.return_value.search_all_resources.side_effect = (
+        exceptions.PermissionDenied("denied")
+    )
+    mock_warning = mocker.patch("skywalker.walkers.asset.logger.warning")
+
+    assert search_project_instances(["p1"]) == {}
+    mock_warning.assert_called_once()
+    assert "p1" in mock_warning.call_args.args[0]
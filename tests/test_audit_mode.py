@@ -0,0 +1,430 @@
+import argparse
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+from google.auth.exceptions import RefreshError
+from proto.datetime_helpers import DatetimeWithNanoseconds
+from rich.console import Console
+
+from skywalker.modes.audit import (
+    JsonReportStream,
+    _render_instance,
+    plan_project_scans,
+    run_audit_for_project,
+    run_fleet_audit,
+    scan_iam,
+)
+from skywalker.schemas.compute import GCPComputeInstance, GCPMachineImage
+from skywalker.schemas.iam import GCPIAMReport, GCPPolicyBinding
+from skywalker.schemas.run import GCPCloudRunService
+from skywalker.schemas.vertex import GCPVertexEndpoint
+
+
+def _instance(name, zone):
+    return GCPComputeInstance(
+        name=name,
+        id="1",
+        status="RUNNING",
+        machine_type="n1-standard-1",
+        zone=zone,
+        creation_timestamp=datetime(2023, 1, 1),
+    )
+
+
+def _service(name, region):
+    return GCPCloudRunService(
+        name=name,
+        region=region,
+        url="https://example.run.app",
+        image="gcr.io/p/img",
+        create_time=datetime(2023, 1, 1),
+        last_modifier="admin@example.com",
+        ingress_traffic="INGRESS_TRAFFIC_ALL",
+        generation=1,
+    )
+
+
+def test_run_audit_for_project_merges_locations(mocker):
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    mock_list = mocker.patch(
+        "skywalker.walkers.compute.list_instances_aggregated",
+        side_effect=lambda zones, **_: [
+            _instance(f"vm-{zone}", zone) for zone in zones if zone.endswith("-b")
+        ],
+    )
+    mocker.patch("skywalker.walkers.compute.list_images", return_value=[])
+    mocker.patch("skywalker.walkers.compute.list_machine_images", return_value=[])
+    mocker.patch("skywalker.walkers.compute.list_snapshots", return_value=[])
+    mocker.patch(
+        "skywalker.walkers.run.list_services",
+        side_effect=lambda region, **_: [_service(f"svc-{region}", region)],
+    )
+
+    report = run_audit_for_project(
+        "proj-1",
+        ["compute", "run"],
+        ["us-west1", "us-east1"],
+        Console(file=io.StringIO()),
+    )
+
+    assert report["project_id"] == "proj-1"
+    mock_list.assert_called_once()
+    instances = report["services"]["compute"].instances
+    assert sorted(i.name for i in instances) == ["vm-us-east1-b", "vm-us-west1-b"]
+    assert sorted(s.region for s in report["services"]["run"]) == [
+        "us-east1",
+        "us-west1",
+    ]
+
+
+def test_run_fleet_audit_summarizes_each_project(mocker):
+    mocker.patch("skywalker.modes.audit.prewarm_clients")
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    mocker.patch("skywalker.walkers.org.list_all_projects", return_value=["p1", "p2"])
+    mocker.patch(
+        "skywalker.walkers.run.list_services",
+        side_effect=lambda project_id, region: [_service(project_id, region)],
+    )
+
+    args = argparse.Namespace(
+        all_projects=True,
+        project_id=None,
+        services=["run"],
+        regions=["us-west1"],
+        metrics=False,
+        concurrency=1,
+        json=False,
+        report=None,
+        html=None,
+    )
+    out = io.StringIO()
+    run_fleet_audit(args, Console(file=io.StringIO()), Console(file=out))
+
+    output = out.getvalue()
+    assert "Project: p1" in output
+    assert "Project: p2" in output
+    assert "Cloud Run: 1 services" in output
+
+
+def test_run_fleet_audit_reports_render_failures(mocker):
+    mocker.patch("skywalker.modes.audit.prewarm_clients")
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    mocker.patch("skywalker.walkers.org.list_all_projects", return_value=["p1", "p2"])
+    mocker.patch(
+        "skywalker.walkers.run.list_services",
+        side_effect=lambda project_id, region: [_service(project_id, region)],
+    )
+    mocker.patch(
+        "skywalker.modes.audit.print_project_summary",
+        side_effect=ValueError("cannot render"),
+    )
+
+    args = argparse.Namespace(
+        all_projects=True,
+        project_id=None,
+        services=["run"],
+        regions=["us-west1"],
+        metrics=False,
+        concurrency=1,
+        json=False,
+        report=None,
+        html=None,
+    )
+    log = io.StringIO()
+    run_fleet_audit(args, Console(file=log), Console(file=io.StringIO()))
+
+    assert "Failed to audit project p1" in log.getvalue()
+    assert "Failed to audit project p2" in log.getvalue()
+
+
+def test_run_audit_for_project_fetches_metrics_once(mocker):
+    mocker.patch(
+        "skywalker.walkers.compute.list_instances_aggregated",
+        return_value=[_instance("vm-1", "us-west1-a")],
+    )
+    mocker.patch("skywalker.walkers.compute.list_images", return_value=[])
+    mocker.patch("skywalker.walkers.compute.list_machine_images", return_value=[])
+    mocker.patch("skywalker.walkers.compute.list_snapshots", return_value=[])
+    mock_metrics = mocker.patch(
+        "skywalker.walkers.compute.fetch_instance_metrics",
+        return_value={"1": {"cpu": 42.0, "mem": 10.0}},
+    )
+
+    report = run_audit_for_project(
+        "proj-1",
+        ["compute"],
+        ["us-west1", "us-east1"],
+        Console(file=io.StringIO()),
+        include_metrics=True,
+    )
+
+    mock_metrics.assert_called_once_with("proj-1")
+    (inst,) = report["services"]["compute"].instances
+    assert inst.cpu_utilization == 42.0
+    assert inst.memory_usage == 10.0
+
+
+def test_run_fleet_audit_json_output(mocker, capsys):
+    mocker.patch("skywalker.modes.audit.prewarm_clients")
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    mocker.patch(
+        "skywalker.walkers.run.list_services",
+        side_effect=lambda project_id, region: [_service(project_id, region)],
+    )
+
+    args = argparse.Namespace(
+        all_projects=False,
+        project_id="p1",
+        services=["run"],
+        regions=["us-west1"],
+        metrics=False,
+        concurrency=1,
+        json=True,
+        report=None,
+        html=None,
+    )
+    run_fleet_audit(args, Console(file=io.StringIO()), Console(file=io.StringIO()))
+
+    (entry,) = json.loads(capsys.readouterr().out)
+    assert entry["project_id"] == "p1"
+    assert entry["services"]["run"] == [
+        _service("p1", "us-west1").model_dump(mode="json")
+    ]
+
+
+def test_run_fleet_audit_json_closed_on_fatal_error(mocker, capsys):
+    mocker.patch("skywalker.modes.audit.prewarm_clients")
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    mocker.patch("skywalker.walkers.org.list_all_projects", return_value=["p1", "p2"])
+    mocker.patch(
+        "skywalker.walkers.run.list_services",
+        side_effect=RefreshError("token expired"),
+    )
+
+    args = argparse.Namespace(
+        all_projects=True,
+        project_id=None,
+        services=["run"],
+        regions=["us-west1"],
+        metrics=False,
+        concurrency=1,
+        json=True,
+        report=None,
+        html=None,
+    )
+    with pytest.raises(RefreshError):
+        run_fleet_audit(args, Console(file=io.StringIO()), Console(file=io.StringIO()))
+
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_run_audit_for_project_merges_vertex_regions(mocker):
+    def fake_endpoints(project_id, location):
+        return [
+            GCPVertexEndpoint(
+                name=f"{project_id}-{location}",
+                display_name="ep",
+                deployed_models=1,
+                location=location,
+            )
+        ]
+
+    mocker.patch("skywalker.walkers.vertex.list_notebooks", return_value=[])
+    mocker.patch("skywalker.walkers.vertex.list_models", return_value=[])
+    mocker.patch("skywalker.walkers.vertex.list_endpoints", side_effect=fake_endpoints)
+
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+
+    report = run_audit_for_project(
+        "proj-1", ["vertex"], ["us-west1", "us-east1"], Console(file=io.StringIO())
+    )
+
+    vertex_report = report["services"]["vertex"]
+    assert sorted(e.location for e in vertex_report.endpoints) == [
+        "us-east1",
+        "us-west1",
+    ]
+    assert vertex_report.notebooks == []
+    assert vertex_report.models == []
+
+
+def test_run_audit_for_project_skips_inactive_regions(mocker):
+    mocker.patch(
+        "skywalker.walkers.asset.search_resource_locations",
+        return_value={
+            "run.googleapis.com/Service": {"us-east1"},
+            "container.googleapis.com/Cluster": {"us-west1-b"},
+        },
+    )
+    mock_run = mocker.patch(
+        "skywalker.walkers.run.list_services",
+        side_effect=lambda region, **_: [_service(f"svc-{region}", region)],
+    )
+    mock_gke = mocker.patch(
+        "skywalker.walkers.gke.list_clusters_all_locations", return_value=[]
+    )
+
+    report = run_audit_for_project(
+        "proj-1",
+        ["run", "gke"],
+        ["us-west1", "us-east1", "us-central1"],
+        Console(file=io.StringIO()),
+    )
+
+    mock_run.assert_called_once_with(project_id="proj-1", region="us-east1")
+    mock_gke.assert_called_once()
+    assert set(mock_gke.call_args.kwargs["locations"]) >= {"us-west1", "us-west1-b"}
+    assert "us-east1" not in mock_gke.call_args.kwargs["locations"]
+    assert [s.region for s in report["services"]["run"]] == ["us-east1"]
+
+
+@pytest.mark.parametrize(
+    "service, client_path, method",
+    [
+        ("run", "skywalker.walkers.run.get_run_client", "list_services"),
+        ("storage", "skywalker.walkers.storage.get_storage_client", "list_buckets"),
+        ("gke", "skywalker.walkers.gke.get_gke_client", "list_clusters"),
+    ],
+)
+def test_run_audit_for_project_fails_fast_on_bad_credentials(
+    mocker, service, client_path, method
+):
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    client = mocker.patch(client_path).return_value
+    getattr(client, method).side_effect = RefreshError("token expired")
+
+    with pytest.raises(RefreshError):
+        run_audit_for_project(
+            "proj-1", [service], ["us-west1"], Console(file=io.StringIO())
+        )
+
+
+def test_plan_project_scans_dedupes_regions(mocker):
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+
+    tasks = plan_project_scans(
+        "proj-1",
+        ["run", "gke"],
+        ["us-west1", "us-west1"],
+        Console(file=io.StringIO()),
+    )
+
+    services = [svc for svc, _ in tasks]
+    assert services.count("run") == 1
+    assert services.count("gke") == 1
+
+
+def test_scan_iam_resolves_owner_names(mocker):
+    report = GCPIAMReport(
+        policy_bindings=[
+            GCPPolicyBinding(role="roles/owner", members=["user:a@x.org"]),
+            GCPPolicyBinding(role="roles/owner", members=["user:b@x.org"]),
+            GCPPolicyBinding(role="roles/viewer", members=["user:c@x.org"]),
+        ]
+    )
+    mocker.patch("skywalker.walkers.iam.get_iam_report", return_value=report)
+    resolver = mocker.patch("skywalker.modes.audit.get_user_resolver").return_value
+    resolver.get_display_names.return_value = {"a@x.org": "Alice"}
+
+    result = scan_iam("proj-1")
+
+    (owners,), _ = resolver.get_display_names.call_args
+    assert owners == {"a@x.org", "b@x.org"}
+    assert result.user_display_names == {"a@x.org": "Alice"}
+
+
+def test_render_instance_line():
+    inst = _instance("vm-1", "us-west1-b")
+    inst.internal_ip = "10.0.0.2"
+    inst.cpu_utilization = 95.0
+
+    line = _render_instance(inst, include_metrics=True)
+
+    assert line.plain == (
+        " - vm-1 (n1-standard-1) [RUNNING] | Created: 2023-01-01"
+        " | 0 Disks | IP: 10.0.0.2 | CPU: 95.0%"
+    )
+    styled = {line.plain[span.start : span.end]: span.style for span in line.spans}
+    assert styled == {"vm-1": "green", "CPU: 95.0%": "bold red"}
+
+
+def test_json_report_stream_writes_array():
+    out = io.BytesIO()
+    stream = JsonReportStream(out)
+    for pid in ("p1", "p2"):
+        stream.write(
+            {
+                "project_id": pid,
+                "scan_time": datetime(2023, 1, 1),
+                "services": {"run": [_service(pid, "us-west1")]},
+            }
+        )
+    stream.close()
+
+    entries = json.loads(out.getvalue())
+    assert [e["project_id"] for e in entries] == ["p1", "p2"]
+    assert entries[0]["scan_time"] == "2023-01-01T00:00:00"
+    assert entries[1]["services"]["run"][0]["name"] == "p2"
+
+
+def test_json_report_stream_empty():
+    out = io.BytesIO()
+    JsonReportStream(out).close()
+
+    assert json.loads(out.getvalue()) == []
+
+
+def test_run_audit_for_project_global_services(mocker):
+    mocker.patch("skywalker.walkers.sql.list_instances", side_effect=Exception("x"))
+    mocker.patch("skywalker.walkers.storage.list_buckets", return_value=[])
+
+    report = run_audit_for_project(
+        "proj-1", ["sql", "storage"], ["us-west1"], Console(file=io.StringIO())
+    )
+
+    # A failed project-level scan is left out rather than failing the project
+    assert "sql" not in report["services"]
+    assert report["services"]["storage"] == []
+
+
+def test_run_audit_for_project_keeps_other_image_listings(mocker):
+    mocker.patch("skywalker.walkers.asset.search_resource_locations", return_value=None)
+    mocker.patch("skywalker.walkers.compute.list_instances_aggregated", return_value=[])
+    mocker.patch("skywalker.walkers.compute.list_images", side_effect=Exception("x"))
+    machine_image = GCPMachineImage(
+        name="mi", id="1", creation_timestamp=datetime(2023, 1, 1), status="READY"
+    )
+    mocker.patch(
+        "skywalker.walkers.compute.list_machine_images", return_value=[machine_image]
+    )
+    mocker.patch("skywalker.walkers.compute.list_snapshots", return_value=[])
+
+    report = run_audit_for_project(
+        "proj-1", ["compute"], ["us-west1"], Console(file=io.StringIO())
+    )
+
+    compute_report = report["services"]["compute"]
+    assert compute_report.images == []
+    assert compute_report.machine_images == [machine_image]
+
+
+def test_json_report_stream_encodes_proto_timestamps():
+    service = _service("p1", "us-west1")
+    service.create_time = DatetimeWithNanoseconds(2023, 1, 1, tzinfo=timezone.utc)
+
+    out = io.BytesIO()
+    stream = JsonReportStream(out)
+    stream.write(
+        {
+            "project_id": "p1",
+            "scan_time": datetime(2023, 1, 2, tzinfo=timezone.utc),
+            "services": {"run": [service]},
+        }
+    )
+    stream.close()
+
+    (entry,) = json.loads(out.getvalue())
+    assert entry["scan_time"] == "2023-01-02T00:00:00Z"
+    assert entry["services"]["run"][0]["create_time"] == "2023-01-01T00:00:00Z"
@@ -0,0 +1,117 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from google.auth.exceptions import DefaultCredentialsError
+
+from skywalker import clients
+from skywalker.clients import ClientPool, _grpc_pool, _shared
+from skywalker.core import GRPC_KEEPALIVE_TIME_MS
+
+
+def test_client_pool_round_robin():
+    pool = ClientPool(["a", "b", "c"])
+
+    assert len(pool) == 3
+    assert [pool.get() for _ in range(6)] == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_grpc_pool_uses_distinct_channels(mocker):
+    mock_client_cls = mocker.Mock()
+    transport_cls = mock_client_cls.get_transport_class.return_value
+
+    pool = _grpc_pool(mock_client_cls, size=2)
+
+    assert len(pool) == 2
+    mock_client_cls.get_transport_class.assert_called_once_with("grpc")
+
+    # Each transport gets its own channel factory tagged with a pool index
+    factories = [c.kwargs["channel"] for c in transport_cls.call_args_list]
+    for index, factory in enumerate(factories):
+        factory("monitoring.googleapis.com", options=[("opt", 1)])
+        _, kwargs = transport_cls.create_channel.call_args
+        options = dict(kwargs["options"])
+        assert options["opt"] == 1
+        assert options["grpc.channel_pooling_index"] == index
+
+        assert options["grpc.keepalive_time_ms"] == GRPC_KEEPALIVE_TIME_MS
+        assert options["grpc.keepalive_permit_without_calls"] == 1
+        # Retries are left to each GAPIC method's default Retry/timeout
+        assert "grpc.service_config" not in options
+
+
+def test_shared_factory_builds_once_under_concurrency():
+    calls = []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.01)
+        return object()
+
+    get = _shared(build)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients_seen = list(executor.map(lambda _: get(), range(8)))
+
+    assert len(calls) == 1
+    assert all(c is clients_seen[0] for c in clients_seen)
+
+
+def test_sql_client_is_per_thread(mocker):
+    mocker.patch.object(clients, "_sql_local", clients.local())
+    mocker.patch.object(clients, "_default_credentials")
+    mocker.patch("google_auth_httplib2.AuthorizedHttp")
+    mock_build = mocker.patch("googleapiclient.discovery.build")
+    mock_build.side_effect = lambda *_args, **_kwargs: mocker.Mock()
+
+    main_client = clients.get_sql_client()
+    assert clients.get_sql_client() is main_client
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        worker_client = executor.submit(clients.get_sql_client).result()
+
+    assert worker_client is not main_client
+    assert mock_build.call_count == 2
+
+
+def test_prewarm_clients_builds_requested_services(mocker):
+    compute_factory = mocker.Mock()
+    run_factory = mocker.Mock()
+    mocker.patch.dict(
+        clients.SERVICE_CLIENTS,
+        {"compute": (compute_factory,), "run": (run_factory,)},
+        clear=True,
+    )
+
+    clients.prewarm_clients(frozenset({"compute"}))
+
+    compute_factory.assert_called_once_with()
+    run_factory.assert_not_called()
+
+
+def test_prewarm_clients_skips_failing_service(mocker):
+    failing = mocker.Mock(side_effect=Exception("bad project"))
+    skipped = mocker.Mock()
+    run_factory = mocker.Mock()
+    mocker.patch.dict(
+        clients.SERVICE_CLIENTS,
+        {"compute": (failing, skipped), "run": (run_factory,)},
+        clear=True,
+    )
+
+    clients.prewarm_clients(["compute", "run"])
+
+    skipped.assert_not_called()
+    run_factory.assert_called_once_with()
+
+
+def test_prewarm_clients_stops_on_bad_credentials(mocker):
+    failing = mocker.Mock(side_effect=DefaultCredentialsError("no credentials"))
+    never_called = mocker.Mock()
+    mocker.patch.dict(
+        clients.SERVICE_CLIENTS,
+        {"compute": (failing,), "run": (never_called,)},
+        clear=True,
+    )
+
+    clients.prewarm_clients(["compute", "run"])
+
+    never_called.assert_not_called()
@@ -1,14 +1,17 @@
 import pytest
+from google.auth.exceptions import RefreshError
 
 from skywalker.walkers.compute import (
+    apply_instance_metrics,
+    fetch_instance_metrics,
     list_images,
-    list_instances,
+    list_instances_aggregated,
     list_machine_images,
     list_snapshots,
 )
 
 
-def test_list_instances_deep_mock(mocker):
+def test_list_instances_aggregated_deep_mock(mocker):
     # Mock the Client Getters
     mock_get_client = mocker.patch(
         "skywalker.walkers.compute.get_compute_instances_client"
@@ -47,10 +50,14 @@ def test_list_instances_deep_mock(mocker):
     mock_instance.network_interfaces = [mock_nic]
 
     # Configure the mock client
-    mock_client_instance.list.return_value = [mock_instance]
+    mock_client_instance.aggregated_list.return_value = [
+        ("zones/us-west1-b", mocker.Mock(instances=[mock_instance]))
+    ]
 
     # Call the function
-    instances = list_instances(project_id="test-project", zone="us-west1-b")
+    instances = list_instances_aggregated(
+        project_id="test-project", zones={"us-west1-b"}
+    )
 
     # Assertions
     assert len(instances) == 1
@@ -68,7 +75,41 @@ def test_list_instances_deep_mock(mocker):
     assert inst.internal_ip == "10.0.0.1"
     assert inst.external_ip == "34.1.2.3"
 
-    mock_client_instance.list.assert_called_once()
+    mock_client_instance.aggregated_list.assert_called_once()
+
+
+def test_list_instances_aggregated_filters_zones(mocker):
+    mock_get_client = mocker.patch(
+        "skywalker.walkers.compute.get_compute_instances_client"
+    )
+    mock_client = mock_get_client.return_value
+
+    def make_instance(name):
+        inst = mocker.Mock()
+        inst.name = name
+        inst.id = 1
+        inst.status = "RUNNING"
+        inst.machine_type = "n1-standard-1"
+        inst.creation_timestamp = "2023-01-01"
+        inst.labels = {}
+        inst.guest_accelerators = []
+        inst.disks = []
+        inst.network_interfaces = []
+        return inst
+
+    mock_client.aggregated_list.return_value = [
+        ("zones/us-west1-b", mocker.Mock(instances=[make_instance("in-scope")])),
+        ("zones/europe-west1-b", mocker.Mock(instances=[make_instance("skipped")])),
+        ("zones/us-west1-c", mocker.Mock(instances=[])),
+    ]
+
+    instances = list_instances_aggregated("test-project", {"us-west1-b", "us-west1-c"})
+
+    assert [i.name for i in instances] == ["in-scope"]
+    assert instances[0].zone == "us-west1-b"
+    mock_client.aggregated_list.assert_called_once()
+    request = mock_client.aggregated_list.call_args.kwargs["request"]
+    assert request.project == "test-project"
 
 
 def test_list_images_mock(mocker):
@@ -91,6 +132,15 @@ def test_list_images_mock(mocker):
     assert images[0].archive_size_bytes == 1073741824
 
 
+def test_list_images_does_not_retry_bad_credentials(mocker):
+    mock_get = mocker.patch("skywalker.walkers.compute.get_compute_images_client")
+    mock_get.return_value.list.side_effect = RefreshError("token expired")
+
+    with pytest.raises(RefreshError):
+        list_images("test-project")
+    mock_get.return_value.list.assert_called_once()
+
+
 def test_list_machine_images_mock(mocker):
     mock_get = mocker.patch(
         "skywalker.walkers.compute.get_compute_machine_images_client"
@@ -154,7 +204,9 @@ def test_list_instances_with_metrics(mocker):
     mock_inst.disks = []
     mock_inst.network_interfaces = []
 
-    mock_compute.list.return_value = [mock_inst]
+    mock_compute.aggregated_list.return_value = [
+        ("zones/us-central1-a", mocker.Mock(instances=[mock_inst]))
+    ]
 
     # Mock Metrics response
     # 1. CPU
@@ -180,7 +232,8 @@ def test_list_instances_with_metrics(mocker):
     ]
 
     # Call with metrics
-    instances = list_instances("test-project", "us-central1-a", include_metrics=True)
+    instances = list_instances_aggregated("test-project", {"us-central1-a"})
+    apply_instance_metrics(instances, fetch_instance_metrics("test-project"))
 
     assert len(instances) == 1
     assert instances[0].cpu_utilization == pytest.approx(42.0)
@@ -211,7 +264,9 @@ def test_list_instances_gpu_metrics(mocker):
     mock_inst.disks = []
     mock_inst.network_interfaces = []
 
-    mock_compute.list.return_value = [mock_inst]
+    mock_compute.aggregated_list.return_value = [
+        ("zones/us-zone", mocker.Mock(instances=[mock_inst]))
+    ]
 
     # Mock GPU Util Response
     mock_ts = mocker.Mock()
@@ -221,7 +276,8 @@ def test_list_instances_gpu_metrics(mocker):
     # Side effects: CPU (empty), Mem (empty), GPU Util (hit), GPU Mem (empty)
     mock_monitor.list_time_series.side_effect = [[], [], [mock_ts], []]
 
-    instances = list_instances("test-proj", "us-zone", include_metrics=True)
+    instances = list_instances_aggregated("test-proj", {"us-zone"})
+    apply_instance_metrics(instances, fetch_instance_metrics("test-proj"))
     assert len(instances) == 1
     assert instances[0].gpu_utilization == 0.75
     assert instances[0].gpu_memory_usage is None
@@ -0,0 +1,8 @@
+import humanize
+
+from skywalker.core import format_size
+
+
+def test_format_size_matches_humanize():
+    for n in (0, 1, 999, 1000, 999_950, 10**6, 5_368_709_120, 10**30):
+        assert format_size(n) == humanize.naturalsize(n)
@@ -1,4 +1,4 @@
-from skywalker.walkers.filestore import list_instances
+from skywalker.walkers.filestore import list_instances_all_locations
 
 
 def test_list_filestore_instances(mocker):
@@ -33,7 +33,7 @@ def test_list_filestore_instances(mocker):
     mock_client.list_instances.return_value = [mock_inst]
 
     # Call
-    results = list_instances("test-proj", "us-central1")
+    results = list_instances_all_locations("test-proj", ["us-central1"])
 
     # Assert
     assert len(results) == 1
@@ -44,3 +44,31 @@ def test_list_filestore_instances(mocker):
     assert fs.capacity_gb == 1024
     assert fs.ip_addresses == ["10.0.0.99"]
     assert fs.location == "us-central1"
+
+
+def test_list_instances_all_locations_filters(mocker):
+    mock_get = mocker.patch("skywalker.walkers.filestore.get_filestore_client")
+    mock_client = mock_get.return_value
+
+    def _fs(location):
+        inst = mocker.Mock()
+        inst.name = f"projects/p/locations/{location}/instances/nfs-{location}"
+        inst.tier.name = "BASIC_HDD"
+        inst.state.name = "READY"
+        inst.create_time = "2023-01-01"
+        inst.networks = []
+        inst.file_shares = []
+        return inst
+
+    mock_client.list_instances.return_value = [
+        _fs("us-west1-b"),
+        _fs("us-west1"),
+        _fs("europe-west1-b"),
+    ]
+
+    results = list_instances_all_locations(
+        "p", ["us-west1-a", "us-west1-b", "us-west1"]
+    )
+
+    mock_client.list_instances.assert_called_once_with(parent="projects/p/locations/-")
+    assert [fs.location for fs in results] == ["us-west1-b", "us-west1"]
@@ -43,7 +43,7 @@ def test_install_agent_skip_gke(mocker):
 def test_fix_ops_agent_flow(mocker):
     # Mock deps
     mock_fetch = mocker.patch("skywalker.walkers.monitoring.fetch_fleet_metrics")
-    mock_asset = mocker.patch("skywalker.walkers.asset.search_all_instances")
+    mock_asset = mocker.patch("skywalker.walkers.asset.search_project_instances")
     mock_confirm = mocker.patch("rich.prompt.Confirm.ask")
     mock_install = mocker.patch("skywalker.modes.fix._install_agent")
 
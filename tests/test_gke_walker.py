@@ -1,7 +1,7 @@
-from skywalker.walkers.gke import list_clusters
+from skywalker.walkers.gke import list_clusters_all_locations
 
 
-def test_list_clusters_mock(mocker):
+def test_list_clusters_all_locations_mock(mocker):
     # Mock the Client Getter
     mock_get = mocker.patch("skywalker.walkers.gke.get_gke_client")
     mock_client = mock_get.return_value
@@ -27,10 +27,14 @@ def test_list_clusters_mock(mocker):
     mock_cluster.node_pools = [mock_np]
 
     # Configure the mock client
-    mock_client.list_clusters.return_value = mocker.Mock(clusters=[mock_cluster])
+    mock_client.list_clusters.return_value = mocker.Mock(
+        clusters=[mock_cluster], missing_zones=[]
+    )
 
     # Call the function
-    clusters = list_clusters(project_id="test-project", location="us-west1")
+    clusters = list_clusters_all_locations(
+        project_id="test-project", locations=["us-west1"]
+    )
 
     # Assertions
     assert len(clusters) == 1
@@ -40,3 +44,36 @@ def test_list_clusters_mock(mocker):
     assert c.node_pools[0].node_count == 3
 
     mock_client.list_clusters.assert_called_once()
+
+
+def test_list_clusters_all_locations_filters(mocker):
+    mock_get = mocker.patch("skywalker.walkers.gke.get_gke_client")
+    mock_client = mock_get.return_value
+
+    def cluster(name, location):
+        c = mocker.Mock(node_pools=[])
+        c.name = name
+        c.location = location
+        c.status.name = "RUNNING"
+        c.current_master_version = "1.27.3-gke.100"
+        c.endpoint = "1.2.3.4"
+        c.network = "default"
+        c.subnetwork = "default"
+        return c
+
+    mock_client.list_clusters.return_value = mocker.Mock(
+        clusters=[
+            cluster("zonal", "us-west1-b"),
+            cluster("regional", "us-west1"),
+            cluster("elsewhere", "europe-west1"),
+        ],
+        missing_zones=[],
+    )
+
+    clusters = list_clusters_all_locations(
+        project_id="test-project", locations=("us-west1", "us-west1-b")
+    )
+
+    assert [c.name for c in clusters] == ["zonal", "regional"]
+    (request,) = mock_client.list_clusters.call_args.kwargs.values()
+    assert request.parent == "projects/test-project/locations/-"
@@ -0,0 +1,50 @@
+import argparse
+import json
+
+from skywalker.modes.monitor import run_fleet_monitor
+
+
+def test_run_fleet_monitor_joins_inventory(mocker, tmp_path, capsys):
+    mocker.patch(
+        "skywalker.walkers.monitoring.fetch_fleet_metrics",
+        return_value=[
+            {
+                "project_id": "proj-1",
+                "instance_id": 101,
+                "zone": "us-central1-a",
+                "cpu_percent": 12.5,
+            },
+            {
+                "project_id": "proj-1",
+                "instance_id": 202,
+                "zone": "us-central1-b",
+                "cpu_percent": 95.0,
+                "gpu_utilization": 40.0,
+            },
+        ],
+    )
+    mocker.patch(
+        "skywalker.walkers.asset.search_project_instances",
+        return_value={"101": {"name": "vm-1", "machine_type": "e2-standard-4"}},
+    )
+    html_path = tmp_path / "fleet.html"
+    args = argparse.Namespace(
+        scoping_project="scope",
+        org_id=None,
+        json=True,
+        csv=None,
+        html=str(html_path),
+        limit=10,
+    )
+
+    run_fleet_monitor(args, mocker.MagicMock(), mocker.MagicMock())
+
+    rows = {row["instance_id"]: row for row in json.loads(capsys.readouterr().out)}
+    assert rows["101"]["instance_name"] == "vm-1"
+    assert rows["101"]["machine_type"] == "e2-standard-4"
+    assert rows["202"]["instance_name"] == "unknown"
+    assert rows["202"]["machine_type"] == "unknown"
+
+    html = html_path.read_text()
+    assert "vm-1" in html
+    assert "40.0%" in html
@@ -1,4 +1,7 @@
-from skywalker.walkers.monitoring import fetch_fleet_metrics
+from skywalker.walkers.monitoring import (
+    fetch_fleet_metrics,
+    fetch_inactive_resources_by_project,
+)
 
 
 def test_fetch_fleet_metrics(mocker):
@@ -28,3 +31,36 @@ def test_fetch_fleet_metrics(mocker):
     assert results[0]["project_id"] == "lab-1"
     assert results[0]["cpu_percent"] == 50.0
     assert "memory_percent" not in results[0]
+
+
+def test_fetch_inactive_resources_by_project(mocker):
+    mock_get = mocker.patch("skywalker.walkers.monitoring.get_monitoring_client")
+    mock_client = mock_get.return_value
+
+    def series(project_id, bucket, sent):
+        ts = mocker.Mock()
+        ts.resource.labels = {"project_id": project_id, "bucket_name": bucket}
+        ts.metric.labels = {}
+        ts.points = [mocker.Mock(value=mocker.Mock(double_value=0, int64_value=sent))]
+        return ts
+
+    mock_client.list_time_series.return_value = [
+        series("lab-1", "data", 42),
+        series("lab-1", "idle", 0),
+        series("lab-2", "logs", 7),
+    ]
+
+    results = fetch_inactive_resources_by_project(
+        "scoping-proj",
+        metric_type="storage.googleapis.com/network/sent_bytes_count",
+        resource_type="gcs_bucket",
+        label="bucket_name",
+    )
+
+    assert results == {"lab-1": {"data": 42.0, "idle": 0.0}, "lab-2": {"logs": 7.0}}
+    request = mock_client.list_time_series.call_args.kwargs["request"]
+    assert request["name"] == "projects/scoping-proj"
+    assert list(request["aggregation"].group_by_fields) == [
+        "resource.label.project_id",
+        "resource.label.bucket_name",
+    ]
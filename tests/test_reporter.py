@@ -7,7 +7,7 @@ from skywalker.schemas.storage import GCPBucket
 
 def test_generate_compliance_report_mock(mocker, tmp_path):
     # Mock WeasyPrint HTML class
-    mock_html = mocker.patch("skywalker.reporter.HTML")
+    mock_html = mocker.patch("weasyprint.HTML")
 
     # Sample fleet data (list of project dicts)
     data = [
@@ -33,3 +33,12 @@ def test_list_buckets_mock(mocker):
     assert results[0].name == "my-bucket"
     assert results[0].size_bytes == 1024
     assert results[0].public_access_prevention == "enforced"
+
+
+def test_list_buckets_skips_sizes_without_buckets(mocker):
+    mock_get_storage = mocker.patch("skywalker.walkers.storage.get_storage_client")
+    mock_get_storage.return_value.list_buckets.return_value = []
+    mock_get_monitor = mocker.patch("skywalker.walkers.storage.get_monitoring_client")
+
+    assert list_buckets("test-project") == []
+    mock_get_monitor.return_value.list_time_series.assert_not_called()
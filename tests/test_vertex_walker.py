@@ -1,7 +1,7 @@
-from skywalker.walkers.vertex import get_vertex_report
+from skywalker.walkers.vertex import list_endpoints, list_models, list_notebooks
 
 
-def test_get_vertex_report_mock(mocker):
+def test_list_vertex_resources_mock(mocker):
     # Mock Clients
     mock_get_nb = mocker.patch("skywalker.walkers.vertex.get_notebook_client")
     mock_nb = mock_get_nb.return_value
@@ -9,7 +9,6 @@ def test_get_vertex_report_mock(mocker):
     # Mock aiplatform (high level SDK is harder to mock, so we mock the list methods)
     mock_model_list = mocker.patch("google.cloud.aiplatform.Model.list")
     mock_ep_list = mocker.patch("google.cloud.aiplatform.Endpoint.list")
-    mocker.patch("google.cloud.aiplatform.init")
 
     # Setup Notebooks
     mock_notebook = mocker.Mock()
@@ -34,9 +33,15 @@ def test_get_vertex_report_mock(mocker):
     mock_ep.traffic_split = {"model1": 100}
     mock_ep_list.return_value = [mock_ep]
 
-    report = get_vertex_report("test-project", "us-central1")
-
-    assert len(report.notebooks) == 1
-    assert report.notebooks[0].name == "nb1"
-    assert len(report.models) == 1
-    assert len(report.endpoints) == 1
+    notebooks = list_notebooks("test-project", "us-central1")
+    models = list_models("test-project", "us-central1")
+    endpoints = list_endpoints("test-project", "us-central1")
+
+    assert len(notebooks) == 1
+    assert notebooks[0].name == "nb1"
+    assert len(models) == 1
+    assert len(endpoints) == 1
+    assert endpoints[0].deployed_models == 1
+    mock_model_list.assert_called_once_with(
+        project="test-project", location="us-central1"
+    )
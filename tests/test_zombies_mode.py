@@ -0,0 +1,235 @@
+import argparse
+import json
+from datetime import datetime
+
+from skywalker.modes.zombies import (
+    ZombieHunter,
+    ZombieResource,
+    _report_pool,
+    run_zombie_hunt,
+)
+from skywalker.reporter import render_zombie_report
+from skywalker.schemas.network import GCPAddress
+from skywalker.schemas.storage import GCPBucket
+
+
+def _disk(mocker, name, users, disk_type="pd-ssd", size_gb=100):
+    disk = mocker.Mock(users=users, size_gb=size_gb)
+    disk.name = name
+    disk.type_ = f"projects/p/zones/us-west1-b/diskTypes/{disk_type}"
+    return disk
+
+
+def test_hunt_disks_returns_orphans(mocker):
+    client = mocker.patch("skywalker.modes.zombies.get_disks_client").return_value
+    client.aggregated_list.return_value = [
+        (
+            "zones/us-west1-b",
+            mocker.Mock(
+                disks=[_disk(mocker, "orphan", []), _disk(mocker, "used", ["vm-1"])]
+            ),
+        )
+    ]
+
+    zombies = ZombieHunter(mocker.MagicMock()).hunt_disks("proj-1")
+
+    assert [z.name for z in zombies] == ["orphan"]
+    assert zombies[0].monthly_cost_est == 100 * 0.17
+
+
+def test_run_zombie_hunt_collects_all_hunts(mocker, capsys):
+    for method, cost in (("hunt_disks", 1.0), ("hunt_ips", 7.3), ("hunt_buckets", 2.0)):
+        mocker.patch.object(
+            ZombieHunter,
+            method,
+            side_effect=lambda pid, method=method, cost=cost: [
+                ZombieResource(method, pid, f"{pid}-{method}", "", cost)
+            ],
+        )
+    args = argparse.Namespace(
+        all_projects=False,
+        project_id="proj-1",
+        concurrency=5,
+        json=True,
+        csv=None,
+        html=None,
+        report=None,
+    )
+
+    run_zombie_hunt(args, mocker.MagicMock(), mocker.MagicMock())
+
+    zombies = json.loads(capsys.readouterr().out)
+    assert [z["name"] for z in zombies] == [
+        "proj-1-hunt_ips",
+        "proj-1-hunt_buckets",
+        "proj-1-hunt_disks",
+    ]
+
+
+def _bucket(name, size_gb):
+    return GCPBucket(
+        name=name,
+        location="US",
+        storage_class="STANDARD",
+        public_access_prevention="enforced",
+        creation_timestamp=datetime(2023, 1, 1),
+        size_bytes=size_gb * 1024**3,
+    )
+
+
+def test_hunt_buckets_uses_prefetched_activity(mocker):
+    mocker.patch(
+        "skywalker.walkers.storage.list_buckets",
+        return_value=[_bucket("busy", 10), _bucket("idle", 10)],
+    )
+    per_project = mocker.patch("skywalker.walkers.monitoring.fetch_inactive_resources")
+    hunter = ZombieHunter(mocker.MagicMock(), {"proj-1": {"busy": 5e9, "idle": 0.0}})
+
+    zombies = hunter.hunt_buckets("proj-1")
+
+    assert [z.name for z in zombies] == ["idle"]
+    per_project.assert_not_called()
+
+
+def test_hunt_buckets_falls_back_outside_scope(mocker):
+    mocker.patch(
+        "skywalker.walkers.storage.list_buckets", return_value=[_bucket("b", 10)]
+    )
+    per_project = mocker.patch(
+        "skywalker.walkers.monitoring.fetch_inactive_resources",
+        return_value={"b": 5e9},
+    )
+    hunter = ZombieHunter(mocker.MagicMock(), {"other-proj": {}})
+
+    assert hunter.hunt_buckets("proj-1") == []
+    per_project.assert_called_once()
+
+
+def test_hunt_ips_only_lists_addresses(mocker):
+    mocker.patch(
+        "skywalker.walkers.network.list_addresses",
+        return_value=[
+            GCPAddress(
+                name="unused",
+                address="34.1.2.3",
+                region="us-west1",
+                status="RESERVED",
+                address_type="EXTERNAL",
+            ),
+            GCPAddress(
+                name="in-use",
+                address="34.1.2.4",
+                region="us-west1",
+                status="IN_USE",
+                user="vm-1",
+                address_type="EXTERNAL",
+            ),
+        ],
+    )
+    report = mocker.patch("skywalker.walkers.network.get_network_report")
+
+    zombies = ZombieHunter(mocker.MagicMock()).hunt_ips("proj-1")
+
+    assert [z.name for z in zombies] == ["unused"]
+    report.assert_not_called()
+
+
+def test_run_zombie_hunt_writes_pdf_in_background(mocker, tmp_path):
+    mocker.patch.object(
+        ZombieHunter,
+        "hunt_disks",
+        return_value=[ZombieResource("Disk", "proj-1", "orphan", "100GB", 4.0)],
+    )
+    mocker.patch.object(ZombieHunter, "hunt_ips", return_value=[])
+    mocker.patch.object(ZombieHunter, "hunt_buckets", return_value=[])
+    write_report = mocker.patch("skywalker.reporter.write_report")
+    log_console = mocker.MagicMock()
+    args = argparse.Namespace(
+        all_projects=False,
+        project_id="proj-1",
+        concurrency=5,
+        json=True,
+        csv=None,
+        html=str(tmp_path / "zombies.html"),
+        report=str(tmp_path / "zombies.pdf"),
+    )
+
+    run_zombie_hunt(args, log_console, mocker.MagicMock())
+    # The report worker is FIFO: once this no-op runs, the PDF job has too
+    _report_pool.submit(lambda: None).result()
+
+    writes = {call.args[2]: call.args for call in write_report.call_args_list}
+    html, path, _ = writes["pdf"]
+    assert path == args.report
+    assert "orphan" in html
+    # Both formats are written from the one render
+    assert writes["html"] == (html, args.html, "html")
+    assert any(
+        "PDF Report saved" in str(call.args[0])
+        for call in log_console.print.call_args_list
+    )
+
+
+def test_render_zombie_report_escapes_fields():
+    html = render_zombie_report(
+        [ZombieResource("Disk", "proj-1", "<orphan>", "100GB", 4.0, "Orphaned")],
+        total_waste=4.0,
+    )
+
+    assert "&lt;orphan&gt;" in html
+    assert "$4.00/month" in html
+    assert "<td>$4.00</td>" in html
+
+
+def test_run_zombie_hunt_writes_csv(mocker, tmp_path):
+    mocker.patch.object(
+        ZombieHunter,
+        "hunt_disks",
+        return_value=[ZombieResource("Disk", "proj-1", "orphan", "100GB", 4.0)],
+    )
+    mocker.patch.object(ZombieHunter, "hunt_ips", return_value=[])
+    mocker.patch.object(ZombieHunter, "hunt_buckets", return_value=[])
+    csv_path = tmp_path / "zombies.csv"
+    args = argparse.Namespace(
+        all_projects=False,
+        project_id="proj-1",
+        concurrency=5,
+        json=True,
+        csv=str(csv_path),
+        html=None,
+        report=None,
+    )
+
+    run_zombie_hunt(args, mocker.MagicMock(), mocker.MagicMock())
+
+    assert csv_path.read_text().splitlines() == [
+        "resource_type,project_id,name,details,monthly_cost_est,reason",
+        "Disk,proj-1,orphan,100GB,4.0,",
+    ]
+
+
+def test_hunt_disks_prices_by_type(mocker):
+    client = mocker.patch("skywalker.modes.zombies.get_disks_client").return_value
+    client.aggregated_list.return_value = [
+        (
+            "zones/us-west1-b",
+            mocker.Mock(
+                disks=[
+                    _disk(mocker, "std", [], "pd-standard"),
+                    _disk(mocker, "bal", [], "pd-balanced"),
+                    _disk(mocker, "hd", [], "hyperdisk-balanced"),
+                    _disk(mocker, "ext", [], "pd-extreme"),
+                ]
+            ),
+        )
+    ]
+
+    zombies = ZombieHunter(mocker.MagicMock()).hunt_disks("proj-1")
+
+    assert {z.name: z.monthly_cost_est for z in zombies} == {
+        "std": 100 * 0.04,
+        "bal": 100 * 0.10,
+        "hd": 100 * 0.10,
+        "ext": 100 * 0.04,
+    }
+    assert zombies[1].details == "100GB (pd-balanced)"